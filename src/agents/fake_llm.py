@@ -0,0 +1,67 @@
+"""Offline stand-in for the LLM used by the follow-up generation"""
+import json
+import re
+import threading
+import time
+
+_ISSUE_LINE = re.compile(r"^- \*\*(?P<key>[^*]+)\*\* - (?P<title>.*?)(?: \((?:status|last update): .*\))?$")
+_FIELD_LINE = re.compile(r"^\s+- (?P<field>issue_link|workstream): (?P<value>.*)$")
+
+
+class FakeFollowUpLLM:
+    """
+    Deterministic replacement for the crewAI LLM with the same `call(messages) -> str` method.
+
+    It reads the team report embedded in the prompt and answers with a valid follow-up JSON
+    (one generic follow-up per parent issue), so FollowUpExecutor can run without network access.
+    `latency` adds a delay to every call and the first `failures` calls raise, to exercise
+    concurrency, timeouts and retries.
+    """
+
+    def __init__(self, latency=0.0, failures=0):
+        self.model = "fake-followup-llm"
+        self.latency = latency
+        self.failures = failures
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def call(self, messages):
+        with self._lock:
+            self.calls += 1
+            should_fail = self.calls <= self.failures
+        if self.latency:
+            time.sleep(self.latency)
+        if should_fail:
+            raise RuntimeError("Fake LLM failure")
+
+        prompt = messages if isinstance(messages, str) else messages[-1]["content"]
+        report = prompt.split("<report>", 1)[-1].split("</report>", 1)[0]
+        return json.dumps(self.follow_ups(report))
+
+    @staticmethod
+    def follow_ups(report):
+        """Build the follow-up JSON of a team report"""
+        data = {"name": "", "contacts": [], "updated_issues": [], "no_update_issues": []}
+        section, issue = None, None
+        for line in report.splitlines():
+            if line.startswith("# Team name:"):
+                data["name"] = line.split(":", 1)[1].strip()
+            elif line.startswith("## "):
+                heading = line[3:].strip()
+                section = {"Points of Contact": "contacts", "Updated Issues": "updated_issues",
+                           "Not Updated Issues": "no_update_issues"}.get(heading)
+                issue = None
+            elif section == "contacts" and line.startswith("- "):
+                data["contacts"].append("@" + "".join(line[2:].split()).lower())
+            elif section in ("updated_issues", "no_update_issues") and _ISSUE_LINE.match(line):
+                match = _ISSUE_LINE.match(line)
+                issue = {"id": match["key"], "title": match["title"], "url": "", "workstream": "", "fup": ""}
+                mention = data["contacts"][0] + " " if data["contacts"] else ""
+                issue["fup"] = f"{mention}could you share the current status and next steps of {match['key']}?"
+                data[section].append(issue)
+            elif issue is not None and _FIELD_LINE.match(line):
+                match = _FIELD_LINE.match(line)
+                # Only the fields of the parent issue, child fields are indented further
+                if line.startswith("  - "):
+                    issue["url" if match["field"] == "issue_link" else "workstream"] = match["value"]
+        return data
@@ -0,0 +1,249 @@
+"""Concurrent generation of the per-team follow-ups"""
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from src.connection.rate_limiter import JiraRateLimiter
+from src.storage.report_manifest import load_report_catalog
+from src.utils.issue_rules import prefilled_path
+from src.utils.tokens import estimate_tokens
+
+import json
+import logging
+import os
+import threading
+import time
+
+FOLLOWUP_PROMPT = """
+## Task Overview
+Analyze the Jira issues report for the team {team} and generate structured follow-ups between {start_date} and {end_date}.
+
+The report has the following structure:
+## Team name: <team>
+### Points of Contact
+[Contact list]
+### Updated Issues
+[Recent updates]
+### Not Updated Issues
+[Pending updates]
+### This ends all the issues from the team <team> ###
+
+## Analysis Workflow
+1. Extract the team name (exact match), the points of contact, the updated and non-updated issues
+   and the parent-child issue mappings.
+2. For each parent issue, analyze its description, comments and child issues, and write a follow-up addressing
+   the current progress, blocking issues, required clarifications and specific action items.
+
+## Quality Guidelines
+* Write professional, friendly communications
+* Use @firstnamelastname format for mentions. Example: John Doe -> @johndoe
+* Provide specific, actionable feedback
+* Reference relevant context and updates
+* Keep messages short and focused
+* Use appropriate corporate humor (relaxed but professional)
+* Include emojis for better readability
+* Bold critical information
+* Use bullet points for organization
+* Formatting Rules:
+    * Always use "\\n" for line breaks
+    * Always use "•" for bullet points
+    * Always bold titles with *
+    * Always include relevant emojis
+
+## Output
+Answer only with a JSON object in the following format:
+{{
+    "name": "Exact Team Name",
+    "contacts": ["@firstnamelastname", "@firstnamelastname"],
+    "updated_issues": [
+        {{
+            "id": "ISSUE-KEY",
+            "title": "Exact Issue Title",
+            "url": "https://company.atlassian.net/browse/ISSUE-KEY",
+            "workstream": "Exact Workstream Name",
+            "fup": "Context-specific follow-up with @firstnamelastname mentions when needed"
+        }}
+    ],
+    "no_update_issues": []
+}}
+
+## Report
+<report>
+{report}
+</report>
+"""
+
+REQUIRED_KEYS = ["name", "contacts", "updated_issues", "no_update_issues"]
+
+
+class FollowUpExecutor:
+    """
+    Generate the follow-up JSON of every team report concurrently.
+
+    Each team is an independent LLM call, so up to `max_concurrency` run at once. A call taking longer
+    than `timeout` seconds, failing, or answering with invalid JSON is retried up to `retries` times
+    with jittered backoff. Each team JSON is written as soon as it is ready, in the folder
+    SaveJiraData.generate_consolidated_report reads.
+
+    `llm` is anything with a `call(messages) -> str` method: a crewAI LLM, or FakeFollowUpLLM offline.
+    With an LLMResultCache, teams whose prompt (report content, template and dates) and model did not
+    change reuse the previous result instead of calling the LLM.
+
+    Reports rendered with pre_classify have their rule based follow-ups next to them: these are merged
+    into the LLM result, and teams with no issue left for the LLM don't call it at all.
+    """
+
+    def __init__(self, llm, max_concurrency=4, timeout=180, retries=2, backoff_base=2, max_backoff=30, cache=None):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.llm = llm
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self.cache = cache
+        self.model = getattr(llm, "model", type(llm).__name__)
+        self.logger = logging.getLogger(__name__)
+
+    def run(self, reports_path, json_base_path, folder, start_date, end_date, skip_unchanged=True):
+        """
+        Generate the follow-ups of the team reports in `reports_path` into `json_base_path/folder`.
+        With `skip_unchanged`, teams that already have a JSON generated from their current report are skipped.
+        Returns {team: {"status": "saved" | "cached" | "prefilled" | "skipped" | "failed", "path" or "error"}}
+        """
+        output_dir = os.path.join(json_base_path, folder)
+        os.makedirs(output_dir, exist_ok=True)
+
+        results, pending = {}, []
+        for report in load_report_catalog(reports_path):
+            output_path = os.path.join(output_dir, f"{report['team'].replace(' ', '_')}.json")
+            if skip_unchanged and self._is_up_to_date(report, output_path):
+                results[report["team"]] = {"status": "skipped", "path": output_path}
+            else:
+                pending.append((report, output_path))
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            futures = {
+                executor.submit(self._run_team, report, output_path, start_date, end_date): report["team"]
+                for report, output_path in pending
+            }
+            for future in as_completed(futures):
+                team = futures[future]
+                try:
+                    status, path = future.result()
+                    results[team] = {"status": status, "path": path}
+                except Exception as e:
+                    self.logger.error(f"Follow-ups for team {team} failed: {str(e)}")
+                    results[team] = {"status": "failed", "error": str(e)}
+        return results
+
+    @staticmethod
+    def _is_up_to_date(report, output_path):
+        """The team JSON exists and its report was not re-rendered since, or was re-rendered before it"""
+        if not os.path.exists(output_path):
+            return False
+        return not report["dirty"] or os.path.getmtime(output_path) >= os.path.getmtime(report["path"])
+
+    def summary(self, results):
+        counts = {status: sum(result["status"] == status for result in results.values())
+                  for status in ("saved", "cached", "prefilled", "skipped", "failed")}
+        summary = (f"follow-ups: {counts['saved']} saved, {counts['cached']} from cache, "
+                   f"{counts['prefilled']} only rule based, {counts['skipped']} skipped, {counts['failed']} failed")
+        if self.cache is not None:
+            summary += f", {self.cache.summary()}"
+        return summary
+
+    def build_prompt(self, team, report, start_date, end_date):
+        return FOLLOWUP_PROMPT.format(team=team, report=report, start_date=start_date, end_date=end_date)
+
+    def _run_team(self, report, output_path, start_date, end_date):
+        prefilled = self._load_prefilled(report["path"])
+        if prefilled is not None and prefilled.pop("llm_issues", None) == 0:
+            self._save(output_path, prefilled)
+            return "prefilled", output_path
+
+        with open(report["path"], "r", encoding="utf-8") as f:
+            prompt = self.build_prompt(report["team"], f.read(), start_date, end_date)
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(prompt, self.model)
+            data = self.cache.get(cache_key, prompt_tokens=estimate_tokens(prompt))
+            if data is not None:
+                self._save(output_path, self.merge_prefilled(data, prefilled))
+                return "cached", output_path
+
+        for attempt in range(self.retries + 1):
+            try:
+                response = self._call_with_timeout(prompt)
+                data = self.parse_response(response)
+                self._save(output_path, self.merge_prefilled(data, prefilled))
+                if cache_key is not None:
+                    self.cache.put(cache_key, data)
+                return "saved", output_path
+            except Exception as e:
+                error = e
+                self.logger.warning(f"Follow-ups for team {report['team']} attempt {attempt + 1} failed: {str(e)}")
+            if attempt < self.retries:
+                time.sleep(JiraRateLimiter.backoff_time(attempt, self.backoff_base, self.max_backoff))
+        raise error
+
+    def _call_with_timeout(self, prompt):
+        """
+        Call the LLM on a daemon thread and stop waiting after `timeout` seconds.
+        LLM clients can't be interrupted, so a timed out call is abandoned, not cancelled.
+        """
+        result = {}
+
+        def call():
+            try:
+                result["value"] = self.llm.call([{"role": "user", "content": prompt}])
+            except Exception as e:
+                result["error"] = e
+
+        thread = threading.Thread(target=call, name="followup-llm-call", daemon=True)
+        thread.start()
+        thread.join(self.timeout)
+        if thread.is_alive():
+            raise TimeoutError(f"LLM call timed out after {self.timeout}s")
+        if "error" in result:
+            raise result["error"]
+        return result["value"]
+
+    @staticmethod
+    def parse_response(response):
+        """Extract the team JSON from the LLM answer, which may be wrapped in a markdown code block"""
+        start, end = response.find("{"), response.rfind("}")
+        if start == -1 or end < start:
+            raise ValueError("No JSON object in the LLM response")
+        data = json.loads(response[start:end + 1])
+        missing = [key for key in REQUIRED_KEYS if key not in data]
+        if missing:
+            raise ValueError(f"Missing keys in the LLM response: {missing}")
+        return data
+
+    @staticmethod
+    def _load_prefilled(report_path):
+        path = prefilled_path(report_path)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def merge_prefilled(data, prefilled):
+        """Team JSON with the rule based follow-ups after the LLM ones, the cached LLM result is left untouched"""
+        if prefilled is None:
+            return data
+        merged = dict(data)
+        for section in ("updated_issues", "no_update_issues"):
+            merged[section] = list(data.get(section) or []) + prefilled.get(section, [])
+        if not merged.get("contacts"):
+            merged["contacts"] = prefilled.get("contacts", [])
+        return merged
+
+    @staticmethod
+    def _save(output_path, data):
+        # Write to a temporary file first so the consolidation never reads a partial team JSON
+        tmp_path = output_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4)
+        os.replace(tmp_path, output_path)
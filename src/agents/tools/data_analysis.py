@@ -1,12 +1,14 @@
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field, ConfigDict
+from src.storage.report_index import ReportIndex
+from src.storage.report_manifest import ReportManifest, load_report_catalog
 import os
 import json
 import glob
 
 class ListJiraReportsSchema(BaseModel):
     """Schema for ListJiraReportsSchema inputs"""
-    action: str = Field(description="Action to perform. Possible actions: list_reports")
+    action: str = Field(description="Action to perform. Possible actions: list_reports, list_dirty_reports, list_catalog")
     path_to_markdown_files: str = Field(default=None, description="Path where the markdown files are saved")
 
 class ListJiraReports(BaseTool):
@@ -23,6 +25,8 @@ class ListJiraReports(BaseTool):
         self.path_to_markdown_files = path_to_markdown_files
         actions = {
             "list_reports": lambda: self.list_markdown_reports(),
+            "list_dirty_reports": lambda: self.list_dirty_reports(),
+            "list_catalog": lambda: self.list_report_catalog(),
         }
         if action not in actions:
                 return f"Invalid action. Available actions: {list(actions.keys())}"
@@ -45,26 +49,63 @@ class ListJiraReports(BaseTool):
             return "No markdown files found in the specified directory."
         return "\n".join(markdown_files)
 
+    def list_dirty_reports(self) -> str:
+        """
+        List the markdown files re-rendered by the last report generation, according to the folder manifest.
+        Folders without a manifest list every report
+        Returns:
+            str: A string containing the list of changed markdown files, one per line
+        """
+        if not self.path_to_markdown_files or not os.path.exists(self.path_to_markdown_files):
+            return f"Invalid path or path does not exist: {self.path_to_markdown_files}"
+
+        manifest = ReportManifest(self.path_to_markdown_files)
+        if not manifest.exists:
+            return self.list_markdown_reports()
+        if not manifest.dirty:
+            return "No markdown reports changed since the last run."
+        return "\n".join(manifest.dirty)
+
+    def list_report_catalog(self) -> str:
+        """
+        List the team reports of the directory with their metadata, without opening the reports
+        Returns:
+            str: JSON list with team, file, path, size, issues, updated_issues, tokens and dirty for each report
+        """
+        if not self.path_to_markdown_files or not os.path.exists(self.path_to_markdown_files):
+            return f"Invalid path or path does not exist: {self.path_to_markdown_files}"
+
+        catalog = load_report_catalog(self.path_to_markdown_files)
+        if not catalog:
+            return "No markdown files found in the specified directory."
+        return json.dumps(catalog, indent=4)
+
 
 class ReadJiraReportSchema(BaseModel):
     """Schema for ReadJiraReportSchema inputs"""
-    action: str = Field(description="Action to perform. Possible actions: read_report")
+    action: str = Field(description="Action to perform. Possible actions: read_report, read_section, read_issues")
     file_path: str = Field(description="Full path to the markdown file to be read")
+    section: str = Field(default=None, description="Section read by read_section: Points of Contact, Updated Issues or Not Updated Issues")
+    issue_keys: list[str] = Field(default=None, description="Issue keys read by read_issues")
+    include_children: bool = Field(default=True, description="Whether read_issues also returns the child issues listed under each issue")
 
 class ReadJiraReport(BaseTool):
     name: str = "ReadJiraReport"
-    description: str = "Read contents of a specific Jira markdown report"
+    description: str = "Read contents of a specific Jira markdown report, or only one of its sections or issues"
     model_config = ConfigDict(arbitrary_types_allowed=True)
     args_schema: type[BaseModel] = ReadJiraReportSchema
     file_path: str = Field(default=None, description="Full path to the markdown file to be read")
 
-    def _run(self, action: str, file_path: str) -> str:
+    def _run(self, action: str, file_path: str, section: str = None, issue_keys: list = None,
+             include_children: bool = True) -> str:
         """
         Execute actions
         """
         self.file_path = file_path
         actions = {
             "read_report": lambda: self.read_markdown_report(),
+            "read_section": lambda: self.read_report_section(section),
+            "read_issues": lambda: self.read_report_issues(issue_keys, include_children),
         }
         if action not in actions:
             return f"Invalid action. Available actions: {list(actions.keys())}"
@@ -86,6 +127,55 @@ class ReadJiraReport(BaseTool):
         except Exception as e:
             return f"Error reading file: {str(e)}"
 
+    def __load_index(self):
+        """Byte offset index of the report, or an error message"""
+        if not self.file_path or not os.path.exists(self.file_path):
+            return None, f"Invalid file path or file does not exist: {self.file_path}"
+        index = ReportIndex.load(self.file_path)
+        if index is None:
+            return None, f"No up to date index for {self.file_path}, use the read_report action instead"
+        return index, None
+
+    def read_report_section(self, section) -> str:
+        """
+        Read a single section of a markdown report using its byte offset index
+        Returns:
+            str: The section contents or an error message
+        """
+        index, error = self.__load_index()
+        if error:
+            return error
+        if not section:
+            return f"No section given. Available sections: {list(index.sections)}"
+
+        try:
+            content = index.read_section(self.file_path, section)
+        except Exception as e:
+            return f"Error reading file: {str(e)}"
+        if content is None:
+            return f"Section '{section}' not found. Available sections: {list(index.sections)}"
+        return content
+
+    def read_report_issues(self, issue_keys, include_children=True) -> str:
+        """
+        Read only the given issues of a markdown report using its byte offset index
+        Returns:
+            str: The issues contents or an error message
+        """
+        index, error = self.__load_index()
+        if error:
+            return error
+        if not issue_keys:
+            return "No issue keys given"
+
+        try:
+            content, missing = index.read_issues(self.file_path, issue_keys, include_children)
+        except Exception as e:
+            return f"Error reading file: {str(e)}"
+        if missing:
+            content += f"Issues not found in this report: {', '.join(missing)}\n"
+        return content
+
 class SaveJiraDataSchema(BaseModel):
     """Schema for SaveJiraDataSchema inputs"""
     action: str = Field(description="Action to perform. Possible actions: save_data, generate_consolidated_report")
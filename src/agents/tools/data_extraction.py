@@ -1,17 +1,56 @@
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field, ConfigDict
 from src.connection.jira_connection import JiraConnectionManager
+from src.connection.async_jira_connection import AsyncJiraConnectionManager
+from src.connection.response_cache import JiraResponseCache
+from src.storage.extraction_state import ExtractionWatermarks
+from src.storage.issue_cache import IssueMemoCache
+from src.storage.board_snapshot import BoardSnapshotWriter, iter_board_snapshot
+from src.storage.data_manager import WeeklyDataManager
+from src.storage.issue_history import IssueHistoryDB
+from src.utils.formatters import format_content_to_markdown
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 import pandas as pd
-import os
-from datetime import datetime
+from datetime import datetime, timezone
 from tqdm import tqdm
 
+# Fields requested for every issue. Edit this list to match the fields of your Jira board
+ISSUE_FIELDS = [
+    "key",
+    "summary",
+    "status",
+    "labels",
+    "created",
+    "updated",
+    "description",
+    "customfield_24910", #Related docs
+    "customfield_18717", #Teams
+    "customfield_20650", #Product
+    "customfield_21943", # Points of contact
+    "issuelinks",
+    "comment" # Comments come with the issue instead of one extra request per issue
+]
+
+# Largest page Jira Cloud returns for a search that requests issue fields
+MAX_PAGE_SIZE = 100
+
+
+class IncompleteListingError(RuntimeError):
+    """A page of the board listing failed, the issues after it are missing"""
+
 class JiraDataExtractionSchema(BaseModel):
     """Schema for JiraStorageTools inputs"""
     action: str = Field(description="Action to perform. Possible actions: ingest_board_overview")
     project_id: str = Field(default="", description="ID of the project to extract data from")
     labels: list = Field(default=[], description="Project labels to be filtered")
+    use_async: bool = Field(default=False, description="Fetch issues concurrently with the asyncio connection manager")
+    max_concurrency: int = Field(default=10, description="Maximum number of requests sent at the same time")
+    page_size: int = Field(default=50, description=f"Number of issues per search page (up to {MAX_PAGE_SIZE})")
+    incremental: bool = Field(default=False, description="Only fetch issues updated since the last extraction and merge them into the last board overview")
+    use_response_cache: bool = Field(default=False, description="Reuse Jira responses stored on disk by previous runs")
+    record_history: bool = Field(default=True, description="Append the board snapshot to the partitioned history dataset and the issue history database")
 
 class JiraDataExtraction(BaseTool):
     name: str = "Tools for extracting data from Jira"
@@ -21,40 +60,121 @@ class JiraDataExtraction(BaseTool):
     connection: JiraConnectionManager = Field(default_factory=JiraConnectionManager)
     project_id: str = Field(default="", description="ID of the project to extract data from")
     labels: str = Field(default="", description="Project labels to be filtered")
-
-    def _run(self, action:str, project_id: str, labels: list) -> str:
+    use_async: bool = Field(default=False, description="Fetch issues concurrently with the asyncio connection manager")
+    max_concurrency: int = Field(default=10, description="Maximum number of requests sent at the same time")
+    page_size: int = Field(default=50, description=f"Number of issues per search page (up to {MAX_PAGE_SIZE})")
+    async_connection: Optional[AsyncJiraConnectionManager] = Field(default=None, description="Connection used when use_async is enabled")
+    incremental: bool = Field(default=False, description="Only fetch issues updated since the last extraction")
+    issue_cache: IssueMemoCache = Field(default_factory=IssueMemoCache, description="Issues already fetched during the run")
+    response_cache: Optional[JiraResponseCache] = Field(default=None, description="Persistent cache of Jira responses")
+    record_history: bool = Field(default=True, description="Append the board snapshot to the partitioned history dataset and the issue history database")
+
+    def _run(self, action:str, project_id: str, labels: list, use_async: bool = False, max_concurrency: int = 10,
+             incremental: bool = False, page_size: int = 50, use_response_cache: bool = False,
+             record_history: bool = True) -> str:
         """
         Execute data extraction actions
         """
-        self.connection = JiraConnectionManager()
+        self.response_cache = JiraResponseCache() if use_response_cache else None
+        self.connection = JiraConnectionManager(response_cache=self.response_cache)
         self.project_id = project_id
         self.labels = labels
+        self.use_async = use_async
+        self.max_concurrency = max_concurrency
+        self.incremental = incremental
+        self.page_size = page_size
+        self.record_history = record_history
+        self.issue_cache = IssueMemoCache()
         actions = {
                 "ingest_board_overview": lambda: self.ingest_board_overview(),
             }
         if action not in actions:
                 return f"Invalid action. Available actions: {list(actions.keys())}"
-        return actions[action]()
-
-    def ingest_board_overview(self) -> str:
+        try:
+            if not self.use_async:
+                return actions[action]()
+
+            # Share the rate limiter so both connections back off together when Jira throttles
+            self.async_connection = AsyncJiraConnectionManager(
+                max_concurrency=self.max_concurrency,
+                rate_limiter=self.connection.rate_limiter,
+                response_cache=self.response_cache
+            )
+            try:
+                return actions[action]()
+            finally:
+                self.async_connection.close()
+                self.async_connection = None
+        finally:
+            if self.response_cache is not None:
+                self.response_cache.close()
+
+    def ingest_board_overview(self, base_path="jira-weekly-data") -> str:
         """
-        Return the path of a csv file with the board overview including parent and child issues
+        Return the path of a csv file with the board overview including parent and child issues.
+        In incremental mode only the issues updated since the last run are fetched and merged
+        into the last board overview.
         """
-        parent_issues = self.__get_parent_issues()
-        return self.__create_board_overview(parent_issues)
+        run_started = datetime.now(timezone.utc)
+        watermarks = ExtractionWatermarks(base_path)
+        state = watermarks.get(self.project_id, self.labels) if self.incremental else None
 
-    def __get_issues_count(self):
-        """Get the total issues in the project with a given label"""
-        jql_query = ' AND '.join(f'labels = "{label}"' for label in self.labels)
+        # Generate filename with current date
+        current_date = datetime.now().strftime('%Y-%m-%d')
+        full_path = base_path + "/" + f"mr-program-board-overview-{current_date}.csv"
+
+        # Rows are written as soon as each page is processed, the board is never held in memory.
+        # A failed page discards the whole snapshot, so a partial board never becomes the watermark or history
+        try:
+            with BoardSnapshotWriter(full_path) as writer:
+                summary = self.__update_board_overview(state, writer) if state else None
+                if summary is None:
+                    summary = ""
+                    for rows in self.__iter_board_rows(self.__iter_parent_pages()):
+                        writer.write(rows)
+        except IncompleteListingError as e:
+            return (f"Board listing incomplete, nothing was saved: {str(e)}. Run the extraction again. "
+                    f"Run summary: " + self.__run_summary())
+
+        # An empty board usually means the listing failed, don't use it as a base for the next run
+        history = ""
+        if writer.rows_written:
+            watermarks.set(self.project_id, self.labels, run_started, full_path)
+            if self.record_history:
+                # Streamed from the snapshot file, partitioned by project and week
+                history_path = WeeklyDataManager(base_path).append_board_snapshot(writer.parquet_path, self.project_id)
+                # Only the new snapshot is added to the indexed history, reading just the columns it keeps
+                with IssueHistoryDB(base_path + "/issue-history.sqlite") as issue_history:
+                    issue_history.ingest_board_snapshot(full_path, self.project_id)
+                history = ". History snapshot saved at " + history_path + " and indexed in " + issue_history.path
+        return ("Project overview saved at " + full_path + summary +
+                ". Columnar snapshot saved at " + writer.parquet_path + history + ". Run summary: " + self.__run_summary())
+
+    def __run_summary(self):
+        """Cache statistics of the run"""
+        summaries = [self.issue_cache.summary()]
+        if self.response_cache is not None:
+            summaries.append(self.response_cache.summary())
+        return ", ".join(summaries)
+
+    def __labeled_jql(self, jql_filter=None):
+        """JQL selecting the labeled issues of the project, optionally narrowed by an extra clause"""
+        labels_query = " AND ".join([f'labels = "{label}"' for label in self.labels])
+        jql_query = f'project = {self.project_id} AND {labels_query}'
+        if jql_filter:
+            jql_query += f' AND {jql_filter}'
+        return jql_query
 
+    def __get_issues_count(self, jql_filter=None):
+        """Get the total issues in the project with a given label"""
         params = {
-            "jql": jql_query,
+            "jql": self.__labeled_jql(jql_filter),
             "startAt": 0,
             "maxResults": 0
         }
 
         try:
-            response = self.connection.make_request(
+            response = self.__request(
                 method="GET",
                 endpoint="/rest/api/3/search",
                 params=params
@@ -66,125 +186,117 @@ class JiraDataExtraction(BaseTool):
             return None
 
 
-    def __get_labeled_issues(self, start_at=0, max_results=50):
-        """Get issues with specified labels in a given project using JQL search"""
-        labels_query = " AND ".join([f'labels = "{label}"' for label in self.labels])
-        jql_query = f'project = {self.project_id} AND {labels_query}'
-
-        params = {
-            "jql": jql_query,
-            "startAt": start_at,
-            "maxResults": max_results,
-            "fields": [ #Remove this in the first execution
-                "key",
-                "summary",
-                "status",
-                "labels",
-                "created",
-                "updated",
-                "description",
-                "customfield_24910", #Related docs
-                "customfield_18717", #Teams
-                "customfield_20650", #Product
-                "customfield_21943", # Points of contact
-                "issuelinks"
-            ]
-        }
+    def __labeled_issues_call(self, start_at=0, max_results=50, jql_filter=None, fields=None):
+        """Request used to get a page of issues with specified labels in a given project using JQL search"""
+        return ("GET", "/rest/api/3/search", {
+            "params": {
+                "jql": self.__labeled_jql(jql_filter),
+                "startAt": start_at,
+                "maxResults": max_results,
+                "fields": fields or ISSUE_FIELDS #Remove this in the first execution
+            }
+        })
 
+    def __get_labeled_issues(self, start_at=0, max_results=50, jql_filter=None, fields=None):
+        """Get issues with specified labels in a given project using JQL search"""
+        method, endpoint, kwargs = self.__labeled_issues_call(start_at, max_results, jql_filter, fields)
         try:
-            response = self.connection.make_request(
-                method="GET",
-                endpoint="/rest/api/3/search",
-                params=params
-            )
+            response = self.__request(method=method, endpoint=endpoint, **kwargs)
             if not response or response.status_code != 200:
                 return None
             return response.json()
         except Exception:
             return None
 
-    def __get_parent_issues(self, max_results = 50):
-        """Get all issues using pagination with the max_results size"""
-        all_issues = []
-        start_at = 0
-        total_issues = self.__get_issues_count()
+    def __get_parent_issues(self, jql_filter=None, fields=None):
+        """Get all labeled issues as a list. Only used for small listings (keys, incremental deltas)"""
+        return [issue for page in self.__iter_parent_pages(jql_filter, fields) for issue in page]
+
+    def __iter_parent_pages(self, jql_filter=None, fields=None):
+        """
+        Yield the pages of labeled issues in order. Once the total is known, up to max_concurrency
+        pages are requested at the same time, so listing time depends on concurrency, not page count,
+        while only one window of pages is held in memory.
+        """
+        page_size = max(1, min(self.page_size, MAX_PAGE_SIZE))
+        total_issues = self.__get_issues_count(jql_filter)
         if total_issues is None:
-            return all_issues
+            # The offset based search is not available, use the token based endpoint instead
+            yield from self.__iter_issues_by_token(page_size, jql_filter, fields)
+            return
 
         progress_bar = tqdm(total=total_issues, desc="Fetching issues")
+        seen_keys = set()
+        starts = list(range(0, total_issues, page_size))
+        window = max(1, self.max_concurrency)
+        start_at = 0
+        result = None
 
-        while True:
-            result = self.__get_labeled_issues(start_at)
-
-            if not result or 'issues' not in result:
-                break
-
-            issues = result['issues']
-            all_issues.extend(issues)
-
-            # Update progress bar with the number of new issues fetched
-            progress_bar.update(len(issues))
-
-            if len(issues) < max_results:
-                break
-
-            start_at += max_results
-
-        progress_bar.close()
-        return all_issues
-
-
-    def __format_content_to_markdown(self, content):
-        """Convert Jira's JSON content format to markdown"""
-        if not content or not isinstance(content, dict):
-            return ""
-
-        markdown_text = ""
-
-        for item in content.get("content", []):
-            # Handle headings
-            if item["type"] == "heading":
-                level = item["attrs"]["level"]
-                heading_text = "".join(
-                    content.get("text", "")
-                    for content in item.get("content", [])
-                )
-                markdown_text += f"{'#' * level} {heading_text}\n\n"
-
-            # Handle paragraphs
-            elif item["type"] == "paragraph":
-                paragraph_text = ""
-                for content in item.get("content", []):
-                    if content["type"] == "text":
-                        # Check for marks (bold, italic, etc)
-                        text = content.get("text", "")
-                        if "marks" in content:
-                            for mark in content["marks"]:
-                                if mark["type"] == "strong":
-                                    text = f"**{text}**"
-                        paragraph_text += text
-                    elif content["type"] == "mention":
-                        paragraph_text += f"@{content['attrs'].get('text', '')}"
-                    elif content["type"] == "emoji":
-                        paragraph_text += f":{content['attrs'].get('shortName', '')[1:-1]}:"
-                    elif content["type"] == "inlineCard":
-                        paragraph_text += f"[{content['attrs'].get('url', '')}]"
-                markdown_text += f"{paragraph_text}\n\n"
-
-            # Handle bullet lists
-            elif item["type"] == "bulletList":
-                for list_item in item.get("content", []):
-                    list_content = list_item.get("content", [{}])[0].get("content", [])
-                    item_text = ""
-                    for content in list_content:
-                        if content.get("type") == "text":
-                            item_text += content.get("text", "")
-                        elif content.get("type") == "mention":
-                            item_text += f"@{content['attrs'].get('text', '')}"
-                    markdown_text += f"* {item_text}\n"
-                markdown_text += "\n"
-
-        return markdown_text.strip()
+        try:
+            for i in range(0, len(starts), window):
+                calls = [self.__labeled_issues_call(start, page_size, jql_filter, fields) for start in starts[i:i + window]]
+                for start, response in zip(starts[i:i + window], self.__request_many(calls)):
+                    result = self.__response_json(response)
+                    if not result or 'issues' not in result:
+                        raise IncompleteListingError(f"The page of issues starting at {start} failed")
+                    yield self.__new_issues(result['issues'], seen_keys, progress_bar)
+                start_at = starts[min(i + window, len(starts)) - 1] + page_size
+
+            # Issues created after the count land past the last page, keep reading until a short page
+            while result and len(result.get('issues', [])) == page_size:
+                result = self.__get_labeled_issues(start_at, page_size, jql_filter, fields)
+                if not result or 'issues' not in result:
+                    raise IncompleteListingError(f"The page of issues starting at {start_at} failed")
+                yield self.__new_issues(result['issues'], seen_keys, progress_bar)
+                start_at += page_size
+        finally:
+            progress_bar.close()
+
+    def __new_issues(self, issues, seen_keys, progress_bar):
+        """Issues can shift between pages while they are fetched, skip the duplicates"""
+        issues = [issue for issue in issues if issue['key'] not in seen_keys]
+        seen_keys.update(issue['key'] for issue in issues)
+
+        # Update progress bar with the number of new issues fetched
+        progress_bar.update(len(issues))
+        return issues
+
+    def __iter_issues_by_token(self, page_size, jql_filter=None, fields=None):
+        """Yield pages of labeled issues from /rest/api/3/search/jql, which only supports sequential nextPageToken paging"""
+        next_page_token = None
+        progress_bar = tqdm(desc="Fetching issues")
+
+        try:
+            while True:
+                params = {
+                    "jql": self.__labeled_jql(jql_filter),
+                    "maxResults": page_size,
+                    "fields": fields or ISSUE_FIELDS
+                }
+                if next_page_token:
+                    params["nextPageToken"] = next_page_token
+
+                try:
+                    response = self.__request(method="GET", endpoint="/rest/api/3/search/jql", params=params)
+                    result = response.json()
+                except Exception as e:
+                    raise IncompleteListingError(f"A page of issues failed: {str(e)}") from e
+
+                issues = result.get('issues', [])
+                progress_bar.update(len(issues))
+                yield issues
+
+                next_page_token = result.get('nextPageToken')
+                if result.get('isLast', True) or not next_page_token:
+                    break
+        finally:
+            progress_bar.close()
+
+    def __iter_board_rows(self, parent_pages):
+        """Flatten each page of parents, with its children, into a batch of board rows"""
+        for parent_issues in parent_pages:
+            if parent_issues:
+                yield self.__build_board_rows(parent_issues)
 
 
     def __get_linked_issues(self, fields, parent_key):
@@ -202,48 +314,136 @@ class JiraDataExtraction(BaseTool):
         return child_issues
 
 
-    def __get_issue_details(self, key):
-        """Get details for a specific issue by key"""
-        try:
-            response = self.connection.make_request(
-                method="GET",
-                endpoint=f"/rest/api/3/issue/{key}",
-                params={
-                    "fields": [
-                        "key",
-                        "summary",
-                        "status",
-                        "labels",
-                        "created",
-                        "updated",
-                        "description",
-                        "customfield_24910",
-                        "customfield_18717",
-                        "customfield_20650",
-                        "customfield_21943",
-                        "issuelinks"
-                    ]
-                }
-            )
-            if response and response.status_code == 200:
-                return response.json()
-            return None
-        except Exception:
-            return None
+    def __request(self, method, endpoint, **kwargs):
+        """Send a single request on the active connection"""
+        if self.async_connection is not None:
+            return self.async_connection.request(method, endpoint, **kwargs)
+        return self.connection.make_request(method=method, endpoint=endpoint, **kwargs)
 
-    def __get_issue_comments(self, issue_key):
-        """Get formatted comments for a specific Jira issue"""
-        try:
-            response = self.connection.make_request(
-                method="GET",
-                endpoint=f"/rest/api/3/issue/{issue_key}",
-                params={"fields": ["comment"]}
-            )
+    def __request_many(self, calls, desc=None):
+        """
+        Send a list of (method, endpoint, kwargs) calls and return the responses in the same order.
+        Calls run concurrently, on the async connection or on a pool of max_concurrency threads.
+        Failed calls are returned as None.
+        """
+        if self.async_connection is not None:
+            responses = self.async_connection.request_many(calls)
+        else:
+            def send(call):
+                method, endpoint, kwargs = call
+                try:
+                    return self.connection.make_request(method=method, endpoint=endpoint, **kwargs)
+                except Exception as e:
+                    return e
+
+            with ThreadPoolExecutor(max_workers=max(1, self.max_concurrency)) as executor:
+                responses = list(tqdm(executor.map(send, calls), total=len(calls), desc=desc, disable=desc is None))
+
+        return [
+            response if not isinstance(response, Exception) and response is not None and response.status_code == 200 else None
+            for response in responses
+        ]
+
+    def __issue_details_call(self, key):
+        """Request used to get details for a specific issue by key"""
+        return ("GET", f"/rest/api/3/issue/{key}", {"params": {"fields": ISSUE_FIELDS}})
+
+    def __bulk_issues_call(self, keys, jql_filter=None, fields=None):
+        """Request used to get a batch of issues, with their comments, in a single JQL search"""
+        jql_query = f"key in ({', '.join(keys)})"
+        if jql_filter:
+            jql_query += f" AND {jql_filter}"
+        return ("GET", "/rest/api/3/search", {
+            "params": {
+                "jql": jql_query,
+                "startAt": 0,
+                "maxResults": len(keys),
+                "fields": fields or ISSUE_FIELDS,
+                "validateQuery": "warn"  # Unknown or deleted keys are skipped instead of failing the batch
+            }
+        })
 
-            if not response or response.status_code != 200:
-                return []
+    def __resolve_issues_bulk(self, keys, batch_size=100):
+        """
+        Get the issues for a list of keys using `key in (...)` JQL batches.
+        Returns a dict mapping each requested key to its issue payload (comments included).
+        Keys missing from the search results (e.g. issues moved to another project)
+        fall back to a single GET /issue request, which follows the redirect.
+        Issues already fetched during the run are taken from the issue cache.
+        """
+        resolved = {}
+        for key in dict.fromkeys(keys):
+            issue = self.issue_cache.get(key)
+            if issue is not None:
+                resolved[key] = issue
+        keys = [key for key in dict.fromkeys(keys) if key not in resolved]
+
+        batches = [keys[i:i + batch_size] for i in range(0, len(keys), batch_size)]
+        responses = self.__request_many([self.__bulk_issues_call(batch) for batch in batches],
+                                        desc="Fetching child issues")
+
+        for response in responses:
+            result = self.__response_json(response) or {}
+            for issue in result.get('issues', []):
+                resolved[issue['key']] = issue
+                self.issue_cache.put(issue)
+
+        missing = [key for key in keys if key not in resolved]
+        if missing:
+            responses = self.__request_many([self.__issue_details_call(key) for key in missing])
+            for key, response in zip(missing, responses):
+                issue = self.__response_json(response)
+                if issue:
+                    resolved[key] = issue
+                    self.issue_cache.put(issue, key)
+
+        return resolved
+
+    def __search_keys(self, keys, jql_filter, batch_size=100):
+        """Return the subset of keys matching a JQL clause, using key-only searches"""
+        keys = list(dict.fromkeys(keys))
+        batches = [keys[i:i + batch_size] for i in range(0, len(keys), batch_size)]
+        responses = self.__request_many([self.__bulk_issues_call(batch, jql_filter, ["key"]) for batch in batches])
+
+        matched = set()
+        for response in responses:
+            result = self.__response_json(response) or {}
+            matched.update(issue['key'] for issue in result.get('issues', []))
+        return matched
+
+    def __resolve_comments(self, issues):
+        """
+        Get formatted comments for a list of issue payloads fetched with the comment field.
+        Only issues whose embedded comment list was truncated by Jira need an extra request.
+        """
+        comments = {}
+        truncated = {}
+        for issue in issues:
+            if issue['key'] in comments or issue['key'] in truncated:
+                continue
+            memoized = self.issue_cache.get_comments(issue)
+            comment_field = issue.get('fields', {}).get('comment') or {}
+            if memoized is not None:
+                comments[issue['key']] = memoized
+            elif comment_field.get('total', 0) > len(comment_field.get('comments', [])):
+                truncated[issue['key']] = issue
+            else:
+                comments[issue['key']] = self.__format_comments(issue)
+                self.issue_cache.put_comments(issue, comments[issue['key']])
 
-            issue_data = response.json()
+        responses = self.__request_many([self.__issue_comments_call(key) for key in truncated])
+        for (key, issue), response in zip(truncated.items(), responses):
+            comments[key] = self.__response_comments(response)
+            self.issue_cache.put_comments(issue, comments[key])
+        return comments
+
+    def __issue_comments_call(self, issue_key):
+        """Request used to get the comments of a specific issue"""
+        return ("GET", f"/rest/api/3/issue/{issue_key}", {"params": {"fields": ["comment"]}})
+
+    def __format_comments(self, issue_data):
+        """Get formatted comments from the issue payload of a comments request"""
+        try:
             comments = issue_data.get('fields', {}).get('comment', {}).get('comments', [])
             formatted_comments = []
 
@@ -277,13 +477,113 @@ class JiraDataExtraction(BaseTool):
         except Exception:
             return []
 
-    def __create_board_overview(self, parent_issues, base_path="jira-weekly-data"):
-        """Create a pandas DataFrame from parent and child issues and save it as CSV"""
+    def __response_json(self, response):
+        """Decode a successful response, None when the request failed"""
+        try:
+            return response.json() if response is not None else None
+        except ValueError:
+            return None
+
+    def __response_comments(self, response):
+        """Get formatted comments from a comments response"""
+        issue_data = self.__response_json(response)
+        return self.__format_comments(issue_data) if issue_data else []
+
+    def __update_board_overview(self, state, writer):
+        """
+        Merge the issues updated since the stored watermark into the last board overview,
+        streaming the last snapshot to the writer chunk by chunk.
+        Returns a summary of the update, or None (before writing anything) when a full
+        extraction is needed instead.
+        """
+        since = ExtractionWatermarks.to_jql_date(state['watermark'])
+
+        # Cheap key-only listing of the board, used to detect deleted issues and removed labels
+        current_keys = [issue['key'] for issue in self.__get_parent_issues(fields=["key"])]
+        if not current_keys:
+            return None
+        current = set(current_keys)
+
+        # Only the keys of the last snapshot are loaded to find what changed
+        chunks = [chunk[chunk['parent_issue'] != '']
+                  for chunk in iter_board_snapshot(state['snapshot'], columns=['key', 'parent_issue'])]
+        if not chunks:
+            return None
+        children = pd.concat(chunks)
+
+        # Parents updated since the watermark (a new link also updates the parent)
+        updated_parents = [issue for issue in self.__get_parent_issues(jql_filter=f'updated >= "{since}"')
+                           if issue['key'] in current]
+        refreshed_keys = {issue['key'] for issue in updated_parents}
+
+        # Parents whose already known children were updated since the watermark
+        updated_children = self.__search_keys(children['key'], f'updated >= "{since}"')
+        extra_keys = [key for key in children.loc[children['key'].isin(updated_children), 'parent_issue'].unique()
+                      if key in current and key not in refreshed_keys]
+        refreshed_parents = updated_parents + list(self.__resolve_issues_bulk(extra_keys).values())
+        refreshed_keys.update(extra_keys)
+
+        # The delta is small: keep the new rows grouped by the parent that owns them
+        new_groups = {}
+        for rows in self.__iter_board_rows([refreshed_parents]):
+            for row in rows:
+                new_groups.setdefault(row['parent_issue'] or row['key'], []).append(row)
+
+        # Replace the groups of refreshed parents in place and drop the removed ones
+        written, removed = set(), set()
+        for chunk in iter_board_snapshot(state['snapshot']):
+            owner = chunk['parent_issue'].where(chunk['parent_issue'] != '', chunk['key'])
+            runs = (owner != owner.shift()).cumsum()
+            pieces = []
+            for _, run in chunk.groupby(runs, sort=False):
+                run_owner = owner[run.index[0]]
+                if run_owner not in current:
+                    removed.add(run_owner)
+                elif run_owner in refreshed_keys:
+                    if run_owner not in written:
+                        pieces.append(pd.DataFrame(new_groups.get(run_owner, []), columns=chunk.columns))
+                        written.add(run_owner)
+                else:
+                    pieces.append(run)
+            if pieces:
+                writer.write(pd.concat(pieces, ignore_index=True))
+
+        # Parents that were not in the last snapshot go last, in board order
+        for key in current_keys:
+            if key in new_groups and key not in written:
+                writer.write(new_groups[key])
+
+        return f" (incremental update, {len(refreshed_keys)} parent issues refreshed, {len(removed)} removed)"
+
+    def __build_board_rows(self, parent_issues):
+        """Flatten parent and child issues into the rows of the board overview. List fields are kept as lists"""
         cleaned_issues = []
 
-        # Count total child issues first
-        total_child_issues = sum(len(self.__get_linked_issues(parent['fields'], parent['key'])) for parent in parent_issues)
-        child_progress = tqdm(total=total_child_issues, desc="Processing issues", position=0, leave=True)
+        # Collect every linked child first so they can be fetched in bulk
+        parent_child_keys = {}
+        for parent in parent_issues:
+            # Parents linked as children of other parents are served from the cache
+            self.issue_cache.put(parent)
+            child_keys = []
+            for link in parent['fields'].get('issuelinks', []):
+                if 'outwardIssue' in link:
+                    child_keys.append(link['outwardIssue']['key'])
+                elif 'inwardIssue' in link:
+                    child_keys.append(link['inwardIssue']['key'])
+            parent_child_keys[parent['key']] = child_keys
+
+        child_issues = self.__resolve_issues_bulk(
+            [child_key for child_keys in parent_child_keys.values() for child_key in child_keys]
+        )
+        comments = self.__resolve_comments(list(parent_issues) + list(child_issues.values()))
+
+        children_by_parent = {
+            parent_key: [child_issues.get(child_key) for child_key in child_keys]
+            for parent_key, child_keys in parent_child_keys.items()
+        }
+
+        total_child_issues = sum(len(children) for children in children_by_parent.values())
+        child_progress = tqdm(total=total_child_issues, desc="Processing issues", position=0, leave=False)
         parent_updates = {}  # Store the most recent update date for each parent
 
         for parent in parent_issues:
@@ -292,8 +592,8 @@ class JiraDataExtraction(BaseTool):
             parent_updates[parent_key] = fields.get('updated', '')[:10]
 
             # Get comments for parent
-            parent_comments = self.__get_issue_comments(parent_key)
-            all_comments = '\n'.join([f"{c['date']} - {c['formatted_comment']}" for c in parent_comments])
+            parent_comments = comments.get(parent_key, [])
+            all_comments = [f"{c['date']} - {c['formatted_comment']}" for c in parent_comments]
             last_comment = parent_comments[-1]['formatted_comment'] if parent_comments else ''
             last_comment_date = parent_comments[-1]['date'] if parent_comments else ''
 
@@ -311,7 +611,7 @@ class JiraDataExtraction(BaseTool):
             parent_metadata = {
                 'teams': ', '.join([team.get('value', '') for team in (fields.get('customfield_18717') or [])]),
                 'workstream': workstream,
-                'points_of_contact': ', '.join([poc.get('displayName', '') for poc in (fields.get('customfield_21943') or [])])
+                'points_of_contact': [poc.get('displayName', '') for poc in (fields.get('customfield_21943') or [])]
             }
 
             # Add parent issue
@@ -322,13 +622,13 @@ class JiraDataExtraction(BaseTool):
                 'status': fields.get('status', {}).get('name', ''),
                 'created': fields.get('created', '')[:10],
                 'last_update': parent_updates[parent_key],
-                'description': self.__format_content_to_markdown(fields.get('description', '')),
-                'labels': ', '.join(fields.get('labels', []) or []),
+                'description': format_content_to_markdown(fields.get('description', '')),
+                'labels': list(fields.get('labels', []) or []),
                 'related_docs': fields.get('customfield_24910', ''),
                 'teams': parent_metadata['teams'],
                 'workstream': parent_metadata['workstream'],
                 'points_of_contact': parent_metadata['points_of_contact'],
-                'child_issues': ', '.join(self.__get_linked_issues(fields, parent_key)),
+                'child_issues': self.__get_linked_issues(fields, parent_key),
                 'parent_issue': '',
                 'comments': all_comments,
                 'last_comment_date': last_comment_date,
@@ -336,64 +636,41 @@ class JiraDataExtraction(BaseTool):
             })
 
             # Process child issues
-            for link in fields.get('issuelinks', []):
-                child_key = None
-                if 'outwardIssue' in link:
-                    child_key = link['outwardIssue']['key']
-                elif 'inwardIssue' in link:
-                    child_key = link['inwardIssue']['key']
-
-                if child_key:
-                    child = self.__get_issue_details(child_key)
-                    if child:
-                        child_fields = child['fields']
-                        child_update = child_fields.get('updated', '')[:10]
-
-                        # Get comments for child
-                        child_comments = self.__get_issue_comments(child_key)
-                        child_all_comments = '\n'.join([f"{c['date']} - {c['formatted_comment']}" for c in child_comments])
-                        child_last_comment = child_comments[-1]['formatted_comment'] if child_comments else ''
-                        child_last_comment_date = child_comments[-1]['date'] if child_comments else ''
-
-                        # Update parent's last_update if child is more recent
-                        if child_update > parent_updates[parent_key]:
-                            parent_updates[parent_key] = child_update
-
-                        cleaned_issues.append({
-                            'key': child['key'],
-                            'summary': child_fields.get('summary', ''),
-                            'issue_link': f"https://company.atlassian.net/browse/{child['key']}",
-                            'status': child_fields.get('status', {}).get('name', ''),
-                            'created': child_fields.get('created', '')[:10],
-                            'last_update': child_update,
-                            'description': self.__format_content_to_markdown(child_fields.get('description', '')),
-                            'labels': ', '.join(child_fields.get('labels', []) or []),
-                            'related_docs': child_fields.get('customfield_24910', ''),
-                            'teams': parent_metadata['teams'],
-                            'workstream': parent_metadata['workstream'],
-                            'points_of_contact': parent_metadata['points_of_contact'],
-                            'child_issues': '',
-                            'parent_issue': parent_key,
-                            'comments': child_all_comments,
-                            'last_comment_date': child_last_comment_date,
-                            'last_comment': child_last_comment
-                        })
-                    child_progress.update(1)
+            for child in children_by_parent[parent_key]:
+                if child:
+                    child_fields = child['fields']
+                    child_update = child_fields.get('updated', '')[:10]
+
+                    # Get comments for child
+                    child_comments = comments.get(child['key'], [])
+                    child_all_comments = [f"{c['date']} - {c['formatted_comment']}" for c in child_comments]
+                    child_last_comment = child_comments[-1]['formatted_comment'] if child_comments else ''
+                    child_last_comment_date = child_comments[-1]['date'] if child_comments else ''
+
+                    # Update parent's last_update if child is more recent
+                    if child_update > parent_updates[parent_key]:
+                        parent_updates[parent_key] = child_update
+
+                    cleaned_issues.append({
+                        'key': child['key'],
+                        'summary': child_fields.get('summary', ''),
+                        'issue_link': f"https://company.atlassian.net/browse/{child['key']}",
+                        'status': child_fields.get('status', {}).get('name', ''),
+                        'created': child_fields.get('created', '')[:10],
+                        'last_update': child_update,
+                        'description': format_content_to_markdown(child_fields.get('description', '')),
+                        'labels': list(child_fields.get('labels', []) or []),
+                        'related_docs': child_fields.get('customfield_24910', ''),
+                        'teams': parent_metadata['teams'],
+                        'workstream': parent_metadata['workstream'],
+                        'points_of_contact': parent_metadata['points_of_contact'],
+                        'child_issues': [],
+                        'parent_issue': parent_key,
+                        'comments': child_all_comments,
+                        'last_comment_date': child_last_comment_date,
+                        'last_comment': child_last_comment
+                    })
+                child_progress.update(1)
 
         child_progress.close()
-
-        # Create DataFrame
-        df = pd.DataFrame(cleaned_issues)
-
-        # Generate filename with current date
-        current_date = datetime.now().strftime('%Y-%m-%d')
-        filename = f"mr-program-board-overview-{current_date}.csv"
-
-        # Create full path and ensure directory exists
-        full_path = os.path.join(base_path, filename)
-        os.makedirs(base_path, exist_ok=True)
-
-        # Save DataFrame
-        df.to_csv(full_path, index=False)
-        return "Project overview saved at " + base_path + "/" + filename
-
+        return cleaned_issues
@@ -1,26 +1,65 @@
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field, ConfigDict
-
+from src.storage.board_snapshot import read_board_snapshot
+from src.storage.report_index import ReportIndex
+from src.storage.report_manifest import ReportManifest
+from src.utils.issue_rules import classify_issues, mechanical_issues, mention, prefilled_followup, prefilled_path, \
+    primary_rules
+from src.utils.markdown_writer import MarkdownWriter
+from src.utils.tokens import estimate_file_tokens, estimate_tokens
+
+from concurrent.futures import ProcessPoolExecutor
+
+import hashlib
+import json
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
 import os
+import tempfile
+
+# Bump when the report layout changes, so every team report is re-rendered once
+REPORT_FORMAT_VERSION = 3
+
+# Compaction steps tried in order until a team report fits its token budget:
+# description characters kept, comments kept before the window, comments kept inside it (None keeps all)
+# and whether not updated issues are reduced to one line
+COMPACTION_LEVELS = [
+    (600, 2, None, False),
+    (200, 1, None, False),
+    (200, 1, None, True),
+    (80, 0, 3, True),
+]
+
+# Columns left out of compact reports: repeated on every issue of a board or already shown by the layout
+COMPACT_EXCLUDED_FIELDS = ['issue_link', 'created', 'labels', 'child_issues', 'parent_issue']
 
 class JiraDataProcessingSchema(BaseModel):
     """Schema for JiraStorageTools inputs"""
-    action: str = Field(description="Action to perform. Possible actions: create_teams_markdowns")
-    csv_file: str = Field(default=None, description="Path with the board csv file")
+    action: str = Field(description="Action to perform. Possible actions: create_teams_markdowns, create_windows_markdowns")
+    csv_file: str = Field(default=None, description="Path with the board csv file (or its parquet snapshot)")
     start_date: str = Field(default=None, description="Start date to be filtered")
     end_date: str = Field(default=None, description="End date to be filtered")
+    windows: list[list[str]] = Field(default=None, description="[start_date, end_date] pairs rendered by create_windows_markdowns, e.g. [[\"2025-02-17\", \"2025-02-23\"], [\"2025-02-10\", \"2025-02-23\"]]")
+    workers: int = Field(default=1, description="Processes used to render the team files. 1 renders them serially, 0 uses all cores")
+    token_budget: int = Field(default=None, description="Compact each team report to about this many tokens. Empty keeps the full reports")
+    comments_before: int = Field(default=2, description="Comments kept from before the date window in compact reports")
+    pre_classify: bool = Field(default=False, description="Give rule based follow-ups to the mechanical issues (not updated, no comments, stale, done with open children) instead of leaving them to the LLM")
+    stale_weeks: int = Field(default=4, description="Weeks without updates after which an issue is stale, used with pre_classify")
 
 class JiraDataProcessing(BaseTool):
     name: str = "JiraDataProcessing"
     description: str = "Tools for processing jira data"
     model_config = ConfigDict(arbitrary_types_allowed=True)
     args_schema: type[BaseModel] = JiraDataProcessingSchema
-    csv_file: str = Field(default=None, description="Path with the board csv file")
+    csv_file: str = Field(default=None, description="Path with the board csv file (or its parquet snapshot)")
     start_date: str = Field(default=None, description="Start date to be filtered")
     end_date: str = Field(default=None, description="End date to be filtered")
 
-    def _run(self, action:str, csv_file:str, start_date: str, end_date: list) -> str:
+    def _run(self, action:str, csv_file:str, start_date: str = None, end_date: list = None, windows: list = None,
+             workers: int = 1, token_budget: int = None, comments_before: int = 2, pre_classify: bool = False,
+             stale_weeks: int = 4) -> str:
         """
         Execute data extraction actions
         """
@@ -28,234 +67,479 @@ class JiraDataProcessing(BaseTool):
         self.start_date = start_date
         self.end_date = end_date
         actions = {
-            "create_teams_markdowns": lambda: self.generate_teams_markdown(),
+            "create_teams_markdowns": lambda: self.generate_teams_markdown(
+                workers=workers, token_budget=token_budget, comments_before=comments_before,
+                pre_classify=pre_classify, stale_weeks=stale_weeks),
+            "create_windows_markdowns": lambda: self.generate_windows_markdown(
+                windows, workers=workers, token_budget=token_budget, comments_before=comments_before,
+                pre_classify=pre_classify, stale_weeks=stale_weeks),
         }
         if action not in actions:
                 return f"Invalid action. Available actions: {list(actions.keys())}"
         return actions[action]()
 
-    def generate_teams_markdown(self, base_path = "teams-markdown", separate_by_team=True):
-        # Read CSV file
-        df = pd.read_csv(self.csv_file)
+    def generate_teams_markdown(self, base_path = "teams-markdown", separate_by_team=True, workers=1,
+                                token_budget=None, comments_before=2, pre_classify=False, stale_weeks=4):
+        """
+        Write one markdown report per team (or a single workstream report) to a date-based folder.
+        With `workers` > 1 the team files are rendered by a process pool that reads the board
+        from a memory mapped Arrow file instead of receiving pickled DataFrames.
+
+        With a `token_budget` the reports are compacted for the LLM: only the comments inside the window
+        (plus the last `comments_before` ones) are kept, descriptions are trimmed and redundant columns
+        dropped, stepping through COMPACTION_LEVELS until each team report fits the budget.
+
+        With `pre_classify` the parent issues matched by a rule of src.utils.issue_rules (not updated in the window,
+        no comments, stale for `stale_weeks`, done with open children) get a template follow-up in
+        `<report>.prefilled.json` and are left out of the report, so only the issues that need judgment reach the LLM.
+        """
+        return self.generate_windows_markdown([(self.start_date, self.end_date)], base_path, separate_by_team, workers,
+                                              token_budget, comments_before, pre_classify, stale_weeks)
+
+    def generate_windows_markdown(self, windows, base_path = "teams-markdown", separate_by_team=True, workers=1,
+                                  token_budget=None, comments_before=2, pre_classify=False, stale_weeks=4):
+        """
+        Render the reports of several (start_date, end_date) windows from a single board load.
+        Each window gets its own `<start>_to_<end>` folder, exactly as generate_teams_markdown writes it.
+
+        Team reports are only re-rendered when the board rows they are built from changed. The hashes
+        and the re-rendered (dirty) files are stored in the folder's manifest.json.
+        """
+        if not windows or any(len(window) != 2 for window in windows):
+            raise ValueError("windows must be a non empty list of [start_date, end_date] pairs")
+        if pre_classify and not separate_by_team:
+            raise ValueError("pre_classify needs separate team reports, the follow-ups are stored next to each one")
+
+        # Read the board, from the columnar snapshot when the extraction wrote one
+        df = read_board_snapshot(self.csv_file)
 
         # Convert dates to datetime
         df['last_update'] = pd.to_datetime(df['last_update'])
-        start_date = pd.to_datetime(self.start_date)
-        end_date = pd.to_datetime(self.end_date)
+        start_dates = pd.to_datetime([start for start, _ in windows])
+        end_dates = pd.to_datetime([end for _, end in windows])
 
         # Process teams column (take first team when multiple are present)
-        df['primary_team'] = df['teams'].apply(lambda x: x.split(',')[0].strip() if pd.notna(x) else 'Unassigned')
-        # Create dictionary to store parent-child relationships
-        parent_child = {}
-        for _, row in df.iterrows():
-            if pd.notna(row['parent_issue']):
-                if row['parent_issue'] not in parent_child:
-                    parent_child[row['parent_issue']] = []
-                parent_child[row['parent_issue']].append(row)
-
-        # Sort parents by number of children
-        parent_counts = {k: len(v) for k, v in parent_child.items()}
-
-        def get_parent_priority(issue_key):
-            return parent_counts.get(issue_key, 0)
-
-        if separate_by_team:
-            # Generate separate markdown files for each team
-            teams = sorted(df['primary_team'].unique())
-            for team in teams:
-                team_issues = df[df['primary_team'] == team]
-
-                # Generate markdown content for the team
-                markdown = f"# Team name: {team}\n\n"
-                markdown += "All the issues below are from the same team.\n\n"
-
-                # Add team's points of contact
-                team_contacts = set()
-                for contacts in team_issues['points_of_contact'].dropna():
-                    team_contacts.update([c.strip() for c in contacts.split(',')])
-
-                markdown += "## Points of Contact\n"
-                for contact in sorted(team_contacts):
-                    markdown += f"- {contact}\n"
-                markdown += "\n"
-
-                # Updated Issues
-                markdown += "## Updated Issues\n\n"
-                updated = team_issues[
-                    (team_issues['last_update'] >= self.start_date) &
-                    (team_issues['last_update'] <= self.end_date)
-                ]
-
-                if not updated.empty:
-                    sorted_issues = sorted(
-                        updated.iterrows(),
-                        key=lambda x: get_parent_priority(x[1]['key']),
-                        reverse=True
-                    )
-
-                    for _, issue in sorted_issues:
-                        if pd.isna(issue['parent_issue']):  # Only process parent issues first
-                            markdown += self.__format_issue(issue)
-                            if issue['key'] in parent_child:
-                                for child in parent_child[issue['key']]:
-                                    markdown += self.__format_issue(child, is_child=True)
-                else:
-                    markdown += "No issues updated during this period.\n\n"
-
-                # Not Updated Issues
-                markdown += "## Not Updated Issues\n\n"
-                not_updated = team_issues[
-                    (team_issues['last_update'] < self.start_date) |
-                    (team_issues['last_update'] > self.end_date)
-                ]
-
-                if not not_updated.empty:
-                    sorted_issues = sorted(
-                        not_updated.iterrows(),
-                        key=lambda x: get_parent_priority(x[1]['key']),
-                        reverse=True
-                    )
-
-                    for _, issue in sorted_issues:
-                        if pd.isna(issue['parent_issue']):  # Only process parent issues first
-                            markdown += self.__format_issue(issue)
-                            if issue['key'] in parent_child:
-                                for child in parent_child[issue['key']]:
-                                    markdown += self.__format_issue(child, is_child=True)
-                else:
-                    markdown += "No issues outside this period.\n\n"
-
-                markdown += f"## This ends all the issues from the team {team}\n\n"
-
-                # Create date-based subfolder
-                date_folder = f"{start_date.strftime('%Y-%m-%d')}_to_{end_date.strftime('%Y-%m-%d')}"
-                full_path = os.path.join(base_path, date_folder)
-                os.makedirs(full_path, exist_ok=True)
-
-                # Save to file
-                file_path = f"{full_path}/{team.replace(' ', '_')}.md"
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(markdown)
-            return "Markdowns saved at " + full_path
-        else:
-            #TODO: Remove this workstream part from the code when sharing the open source version
-            # Generate a single markdown file separating issues by workstream
-            workstreams = ['Workstream A', 'Workstream B']
-            markdown = "# Board Status Report\n\n"
-
-            for workstream in workstreams:
-                workstream_issues = df[df['workstream'] == workstream]
-
-                if not workstream_issues.empty:
-                    markdown += f"## Workstream: {workstream}\n\n"
-
-                    # Get unique teams in this workstream
-                    teams = sorted(workstream_issues['primary_team'].unique())
-
-                    for team in teams:
-                        team_issues = workstream_issues[workstream_issues['primary_team'] == team]
-
-                        # Get points of contact for the team
-                        team_contacts = set()
-                        for contacts in team_issues['points_of_contact'].dropna():
-                            team_contacts.update([c.strip() for c in contacts.split(',')])
-
-                        markdown += f"### Team name: {team}\n\n"
-                        markdown += "#### Points of Contact\n"
-                        for contact in sorted(team_contacts):
-                            markdown += f"- {contact}\n"
-                        markdown += "\n"
-
-                        # Updated Issues
-                        markdown += "#### Updated Issues\n\n"
-                        updated = team_issues[
-                            (team_issues['last_update'] >= self.start_date) &
-                            (team_issues['last_update'] <= self.end_date)
-                        ]
-
-                        if not updated.empty:
-                            sorted_issues = sorted(
-                                updated.iterrows(),
-                                key=lambda x: get_parent_priority(x[1]['key']),
-                                reverse=True
-                            )
-
-                            for _, issue in sorted_issues:
-                                if pd.isna(issue['parent_issue']):
-                                    markdown += self.__format_issue(issue)
-                                    if issue['key'] in parent_child:
-                                        for child in parent_child[issue['key']]:
-                                            markdown += self.__format_issue(child, is_child=True)
-                        else:
-                            markdown += "No issues updated during this period.\n\n"
-
-                        # Not Updated Issues
-                        markdown += "#### Not Updated Issues\n\n"
-                        not_updated = team_issues[
-                            (team_issues['last_update'] < self.start_date) |
-                            (team_issues['last_update'] > self.end_date)
-                        ]
-
-                        if not not_updated.empty:
-                            sorted_issues = sorted(
-                                not_updated.iterrows(),
-                                key=lambda x: get_parent_priority(x[1]['key']),
-                                reverse=True
-                            )
-
-                            for _, issue in sorted_issues:
-                                if pd.isna(issue['parent_issue']):
-                                    markdown += self.__format_issue(issue)
-                                    if issue['key'] in parent_child:
-                                        for child in parent_child[issue['key']]:
-                                            markdown += self.__format_issue(child, is_child=True)
-                        else:
-                            markdown += "No issues outside this period.\n\n"
-
-                        markdown += f"#### This ends all the issues from the team {team}\n\n"
-
+        df['primary_team'] = df['teams'].astype(object).str.split(',').str[0].str.strip().fillna('Unassigned')
+
+        # Everything below is computed once for the whole board, the teams only select row positions
+        keys = df['key'].to_numpy()
+        parent_child = df.groupby('parent_issue', sort=False).indices
+        priority = df['key'].map(df['parent_issue'].value_counts()).fillna(0).to_numpy()
+        is_parent = df['parent_issue'].isna().to_numpy()
+        contacts = df['points_of_contact'].astype(object).str.split(',').to_numpy()
+
+        # Updated / not updated masks of every window at once, one row per window
+        last_update = df['last_update'].to_numpy()
+        starts = start_dates.to_numpy()[:, None]
+        ends = end_dates.to_numpy()[:, None]
+        updated = (last_update >= starts) & (last_update <= ends)
+        not_updated = (last_update < starts) | (last_update > ends)
+
+        # Content hash of every board row, a team report only changes when its rows do
+        row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+        # Positions sorted by number of children, issues with the same count keep the board order
+        order = np.argsort(-priority, kind='stable')
+        sorted_df = df.iloc[order]
+        team_groups = sorted_df.groupby('primary_team').indices if separate_by_team else None
+        workstream_groups = None if separate_by_team else sorted_df.groupby(['workstream', 'primary_team']).indices
+
+        def team_plan(team, positions, window, skip=None):
+            team_contacts = {c.strip() for values in contacts[positions] if isinstance(values, list) for c in values}
+            compaction = None
+            if token_budget:
+                compaction = {
+                    "token_budget": token_budget,
+                    "comments_before": comments_before,
+                    "start_date": start_dates[window].strftime('%Y-%m-%d'),
+                    "end_date": end_dates[window].strftime('%Y-%m-%d')
+                }
+            return (
+                team,
+                sorted(team_contacts),
+                _section_plan(positions, updated[window], is_parent, parent_child, keys, skip),
+                _section_plan(positions, not_updated[window], is_parent, parent_child, keys, skip),
+                compaction
+            )
+
+        paths, plans, manifests, rendered = [], [], [], []
+        records, rule_records = None, None
+        for window, (start_date, end_date) in enumerate(zip(start_dates, end_dates)):
             # Create date-based subfolder
             date_folder = f"{start_date.strftime('%Y-%m-%d')}_to_{end_date.strftime('%Y-%m-%d')}"
             full_path = os.path.join(base_path, date_folder)
             os.makedirs(full_path, exist_ok=True)
-
-            # Save to file
-            file_path = f"{full_path}/workstream_report.md"
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(markdown)
-            return "Markdown saved at " + full_path
-
-    def __format_issue(self, issue, is_child=False):
-        prefix = "  " if is_child else ""
-        markdown = f"{prefix}- **{issue['key']}** - {issue['summary']}\n\n"
-
-        # Add description as quote if present
-        if pd.notna(issue['description']):
-            markdown += f"{prefix}  **Description:**\n"
-            description_lines = issue['description'].split('\n')
-            markdown += f"{prefix}  > " + f"\n{prefix}  > ".join(description_lines) + "\n\n"
-
-        # Add comments history as quotes if present
-        if pd.notna(issue['comments']):
-            markdown += f"{prefix}  **Comments History:**\n"
-            comment_lines = issue['comments'].split('\n')
-            for comment in comment_lines:
-                if comment.strip():
-                    markdown += f"{prefix}  > {comment}\n"
-            markdown += "\n"
-
-        # Add last comment if present
-        if pd.notna(issue['last_comment']):
-            markdown += f"{prefix}  **Last Comment ({issue['last_comment_date']}):**\n"
-            markdown += f"{prefix}  > {issue['last_comment']}\n\n"
-
-        # Add all other fields except those already handled
-        excluded_fields = ['key', 'summary', 'description', 'points_of_contact',
-                        'comments', 'last_comment', 'last_comment_date', 'teams', 'primary_team']
-        for column, value in issue.items():
-            if column not in excluded_fields and pd.notna(value):
-                markdown += f"{prefix}  - {column}: {value}\n"
-
-        markdown += "\n"
-        return markdown
-
+            paths.append(full_path)
+
+            if separate_by_team:
+                # Rules of the whole board for this window, evaluated at once
+                mechanical = None
+                if pre_classify:
+                    rules, open_children = classify_issues(df, start_date, end_date, stale_weeks)
+                    mechanical = mechanical_issues(rules)
+                    first_rules = primary_rules(rules)
+                    open_children = open_children.to_numpy()
+                    rule_records = rule_records or df[['key', 'summary', 'status', 'last_update', 'issue_link',
+                                                       'workstream']].to_dict('records')
+
+                # Separate markdown files for each team, the changed ones are rendered below for all windows at once
+                manifest = ReportManifest(full_path)
+                reports, dirty = {}, []
+                for team, positions in team_groups.items():
+                    plan = team_plan(team, order[positions], window, mechanical)
+                    file_name = f"{team.replace(' ', '_')}.md"
+                    prefilled = None
+                    if pre_classify:
+                        prefilled = {"name": team, "contacts": [mention(contact) for contact in plan[1]]}
+                        for section, mask in (("updated_issues", updated[window]), ("no_update_issues", not_updated[window])):
+                            selected = order[positions]
+                            selected = selected[mask[selected] & is_parent[selected] & mechanical[selected]]
+                            prefilled[section] = [
+                                prefilled_followup(rule_records[position], first_rules[position], plan[1],
+                                                   int(open_children[position]), start_date.strftime('%Y-%m-%d'),
+                                                   end_date.strftime('%Y-%m-%d'), stale_weeks)
+                                for position in selected
+                            ]
+                        # Parent issues left in the report for the LLM
+                        prefilled["llm_issues"] = sum(not is_child for section in plan[2:4] if section
+                                                      for _, is_child in section)
+                    content_hash = _team_hash(*plan, row_hashes, prefilled)
+                    reports[file_name] = {
+                        "team": team,
+                        "hash": content_hash,
+                        "issues": sum(len(section) for section in plan[2:4] if section),
+                        "updated_issues": len(plan[2] or [])
+                    }
+                    if manifest.is_current(file_name, content_hash):
+                        # Manifests written before every report had a token estimate get one from the file
+                        tokens = manifest.reports[file_name].get("tokens")
+                        reports[file_name]["tokens"] = tokens if tokens is not None else \
+                            estimate_file_tokens(f"{full_path}/{file_name}")
+                    else:
+                        dirty.append(file_name)
+                        _write_prefilled(f"{full_path}/{file_name}", prefilled)
+                        plans.append((f"{full_path}/{file_name}", *plan))
+                        rendered.append(reports[file_name])
+                manifests.append((manifest, reports, dirty))
+            else:
+                #TODO: Remove this workstream part from the code when sharing the open source version
+                # Generate a single markdown file separating issues by workstream
+                workstreams = ['Workstream A', 'Workstream B']
+                records = records or df.to_dict('records')
+
+                file_path = f"{full_path}/workstream_report.md"
+                with MarkdownWriter(file_path) as writer:
+                    writer.write("# Board Status Report\n\n")
+                    for workstream in workstreams:
+                        teams = sorted(team for group_workstream, team in workstream_groups if group_workstream == workstream)
+                        if teams:
+                            writer.write(f"## Workstream: {workstream}\n\n")
+
+                        for team in teams:
+                            writer.write(f"### Team name: {team}\n\n")
+                            plan = team_plan(team, order[workstream_groups[(workstream, team)]], window)
+                            tokens = _write_team(writer, *plan, records, heading="####")
+                            if tokens is not None:
+                                rendered.append({"team": team, "tokens": tokens})
+
+        if not separate_by_team:
+            return "Markdown saved at " + ", ".join(paths) + _tokens_summary(rendered)
+
+        workers = workers or os.cpu_count()
+        if workers > 1 and len(plans) > 1:
+            token_counts = self.__render_in_processes(df, plans, workers)
+        elif plans:
+            records = df.to_dict('records')
+            token_counts = [_write_team_file(*plan, records) for plan in plans]
+        else:
+            token_counts = []
+        for report, tokens in zip(rendered, token_counts):
+            report["tokens"] = tokens
+
+        # Manifests are only updated once their reports are written
+        for manifest, reports, dirty in manifests:
+            manifest.save(reports, dirty)
+        total = sum(len(reports) for _, reports, _ in manifests)
+        return (f"Markdowns saved at {', '.join(paths)}. Re-rendered {len(plans)} of {total} team reports, "
+                f"the changed ones are listed in the manifest.json of each folder"
+                + _tokens_summary([report for _, reports, _ in manifests for report in reports.values()]))
+
+    def __render_in_processes(self, df, plans, workers):
+        """Render team files in a process pool. The board is shared through a memory mapped Arrow IPC file"""
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            table_path = os.path.join(tmp_dir, "board.arrow")
+            with pa.OSFile(table_path, 'wb') as sink, ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+            with ProcessPoolExecutor(max_workers=min(workers, len(plans)),
+                                     initializer=_init_render_worker, initargs=(table_path,)) as executor:
+                futures = [executor.submit(_render_team_file, *plan) for plan in plans]
+                return [future.result() for future in futures]
+
+
+def _section_plan(positions, mask, is_parent, parent_child, keys, skip=None):
+    """
+    Board positions of one report section in render order, each parent issue followed by its children,
+    as (position, is_child) pairs. None when no issue of the team falls in the section.
+    Parent issues flagged in `skip` are left out with their children.
+    """
+    selected = positions[mask[positions]]
+    if selected.size == 0:
+        return None
+    parents = selected[is_parent[selected]]  # Only process parent issues first
+    if skip is not None:
+        parents = parents[~skip[parents]]
+    plan = []
+    for position in parents:
+        plan.append((int(position), False))
+        plan.extend((int(child), True) for child in parent_child.get(keys[position], ()))
+    return plan
+
+
+def _team_hash(team, contacts, updated_plan, not_updated_plan, compaction, row_hashes, prefilled=None):
+    """
+    Hash of everything a team report is rendered from: its rows, their order, the team contacts, the compaction
+    and the pre-classified follow-ups
+    """
+    header = [REPORT_FORMAT_VERSION, team, contacts, compaction] + ([prefilled] if prefilled is not None else [])
+    digest = hashlib.sha256(json.dumps(header, default=str).encode("utf-8"))
+    for plan in (updated_plan, not_updated_plan):
+        if plan is None:
+            digest.update(b"-")
+            continue
+        positions = [position for position, _ in plan]
+        digest.update(len(plan).to_bytes(8, "little"))
+        digest.update(row_hashes[positions].tobytes())
+        digest.update(bytes(is_child for _, is_child in plan))
+    return digest.hexdigest()
+
+
+def _write_prefilled(file_path, prefilled):
+    """Write the pre-classified follow-ups of a team report, or remove the ones of a previous run"""
+    path = prefilled_path(file_path)
+    if prefilled is None:
+        if os.path.exists(path):
+            os.remove(path)
+        return
+    # Write to a temporary file first so the follow-up generation never reads a partial file
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(prefilled, f, indent=4)
+    os.replace(tmp_path, path)
+
+
+def _tokens_summary(reports):
+    """Estimated tokens of the team reports, for the tool output"""
+    tokens = [report["tokens"] for report in reports if report.get("tokens") is not None]
+    if not tokens:
+        return ""
+    return f". Estimated tokens per team report: max {max(tokens)}, total {sum(tokens)}"
+
+
+def _write_team_file(file_path, team, contacts, updated_plan, not_updated_plan, compaction, records):
+    """Write a team report and its byte offset index, returning the estimated token count of the report"""
+    index = ReportIndex()
+    with MarkdownWriter(file_path) as writer:
+        writer.write(f"# Team name: {team}\n\n", "All the issues below are from the same team.\n\n")
+        _write_team(writer, team, contacts, updated_plan, not_updated_plan, compaction, records, index=index)
+    index.save(file_path)
+    return estimate_file_tokens(file_path)
+
+
+def _write_team(writer, team, contacts, updated_plan, not_updated_plan, compaction, records, heading="##",
+                index=None):
+    if compaction is None:
+        _write_team_sections(writer, team, contacts, updated_plan, not_updated_plan, records, heading, index)
+        return None
+
+    # Render in memory with stricter compaction until the report fits the budget
+    for level in COMPACTION_LEVELS:
+        buffer = MarkdownWriter()
+        level_index = ReportIndex(base_offset=writer.tell()) if index is not None else None
+        _write_team_sections(buffer, team, contacts, updated_plan, not_updated_plan, records, heading, level_index,
+                             compaction, level)
+        markdown = buffer.getvalue()
+        tokens = estimate_tokens(markdown)
+        if tokens <= compaction["token_budget"]:
+            break
+    writer.write(markdown)
+    if index is not None:
+        index.update(level_index)
+    return tokens
+
+
+def _write_team_sections(writer, team, contacts, updated_plan, not_updated_plan, records, heading, index=None,
+                         compaction=None, level=None):
+    start = writer.tell()
+    writer.write(f"{heading} Points of Contact\n")
+    writer.writelines(f"- {contact}\n" for contact in contacts)
+    writer.write("\n")
+    if index is not None:
+        index.add_section("Points of Contact", start, writer.tell())
+
+    start = writer.tell()
+    writer.write(f"{heading} Updated Issues\n\n")
+    _write_section(writer, updated_plan, records, "No issues updated during this period.\n\n", "Updated Issues",
+                   index, compaction, level)
+    if index is not None:
+        index.add_section("Updated Issues", start, writer.tell())
+
+    start = writer.tell()
+    writer.write(f"{heading} Not Updated Issues\n\n")
+    brief = level is not None and level[3]
+    _write_section(writer, not_updated_plan, records, "No issues outside this period.\n\n", "Not Updated Issues",
+                   index, compaction, level, brief)
+    if index is not None:
+        index.add_section("Not Updated Issues", start, writer.tell())
+
+    writer.write(f"{heading} This ends all the issues from the team {team}\n\n")
+
+
+def _write_section(writer, plan, records, empty_message, section, index=None, compaction=None, level=None,
+                   brief=False):
+    if plan is None:
+        writer.write(empty_message)
+        return
+    parent = None
+    for position, is_child in plan:
+        issue = records[position]
+        start = writer.tell()
+        if brief:
+            _format_issue_brief(writer, issue, is_child=is_child)
+        elif compaction is not None:
+            _format_issue_compact(writer, issue, compaction, level, is_child=is_child)
+        else:
+            _format_issue(writer, issue, is_child=is_child)
+        if not is_child:
+            parent = issue['key']
+        if index is not None:
+            index.add_issue(issue['key'], section, start, writer.tell(), parent if is_child else None)
+
+
+def _format_issue(writer, issue, is_child=False):
+    prefix = "  " if is_child else ""
+    writer.write(f"{prefix}- **{issue['key']}** - {issue['summary']}\n\n")
+
+    # Add description as quote if present
+    if pd.notna(issue['description']):
+        writer.write(f"{prefix}  **Description:**\n")
+        description_lines = issue['description'].split('\n')
+        writer.write(f"{prefix}  > ", f"\n{prefix}  > ".join(description_lines), "\n\n")
+
+    # Add comments history as quotes if present
+    if pd.notna(issue['comments']):
+        writer.write(f"{prefix}  **Comments History:**\n")
+        comment_lines = issue['comments'].split('\n')
+        writer.writelines(f"{prefix}  > {comment}\n" for comment in comment_lines if comment.strip())
+        writer.write("\n")
+
+    # Add last comment if present
+    if pd.notna(issue['last_comment']):
+        writer.write(f"{prefix}  **Last Comment ({issue['last_comment_date']}):**\n")
+        writer.write(f"{prefix}  > {issue['last_comment']}\n\n")
+
+    # Add all other fields except those already handled
+    excluded_fields = ['key', 'summary', 'description', 'points_of_contact',
+                    'comments', 'last_comment', 'last_comment_date', 'teams', 'primary_team']
+    for column, value in issue.items():
+        if column not in excluded_fields and pd.notna(value):
+            writer.write(f"{prefix}  - {column}: {value}\n")
+
+    writer.write("\n")
+
+
+def _is_dated(line):
+    return len(line) >= 10 and line[4] == '-' and line[7] == '-' and line[:10].replace('-', '').isdigit()
+
+
+def _split_comments(comments):
+    """
+    Split the comments history into comments, each a list of lines. Comments start with their 'YYYY-MM-DD'
+    date, lines without one continue the comment above them
+    """
+    grouped = []
+    for line in comments.split('\n'):
+        if not line.strip():
+            continue
+        if _is_dated(line) or not grouped:
+            grouped.append([line])
+        else:
+            grouped[-1].append(line)
+    return grouped
+
+
+def _format_issue_compact(writer, issue, compaction, level, is_child=False):
+    """Compact version of _format_issue for token budgeted reports"""
+    description_chars, comments_before, comments_inside, _ = level
+    comments_before = min(comments_before, compaction["comments_before"])
+    prefix = "  " if is_child else ""
+    writer.write(f"{prefix}- **{issue['key']}** - {issue['summary']}\n\n")
+
+    # Trimmed description
+    if pd.notna(issue['description']):
+        description = " ".join(issue['description'].split())
+        if len(description) > description_chars:
+            description = description[:description_chars].rstrip() + "..."
+        writer.write(f"{prefix}  **Description:**\n", f"{prefix}  > {description}\n\n")
+
+    # Comments inside the window plus the last ones before it, filtered as whole comments
+    if pd.notna(issue['comments']):
+        comments = _split_comments(issue['comments'])
+        before = [c for c in comments if c[0][:10] < compaction["start_date"]]
+        inside = [c for c in comments if compaction["start_date"] <= c[0][:10] <= compaction["end_date"]
+                  or not _is_dated(c[0])]
+        if comments_inside is not None:
+            inside = inside[-comments_inside:]
+        kept = (before[-comments_before:] if comments_before else []) + inside
+        omitted = len(comments) - len(kept)
+        if kept or omitted:
+            writer.write(f"{prefix}  **Comments History:**\n")
+            if omitted:
+                writer.write(f"{prefix}  > ({omitted} other comments omitted)\n")
+            writer.writelines(f"{prefix}  > {line}\n" for comment in kept for line in comment)
+            writer.write("\n")
+
+    # Remaining fields, without the redundant ones. The last comment is already in the comments history
+    excluded_fields = ['key', 'summary', 'description', 'points_of_contact', 'comments', 'last_comment',
+                       'last_comment_date', 'teams', 'primary_team'] + COMPACT_EXCLUDED_FIELDS
+    for column, value in issue.items():
+        if column not in excluded_fields and pd.notna(value):
+            if isinstance(value, pd.Timestamp):
+                value = value.strftime('%Y-%m-%d')
+            writer.write(f"{prefix}  - {column}: {value}\n")
+
+    writer.write("\n")
+
+
+def _format_issue_brief(writer, issue, is_child=False):
+    """One line per issue, used for the not updated issues of reports over their token budget"""
+    prefix = "  " if is_child else ""
+    details = []
+    if pd.notna(issue['status']):
+        details.append(f"status: {issue['status']}")
+    if pd.notna(issue['last_update']):
+        details.append(f"last update: {issue['last_update'].strftime('%Y-%m-%d')}")
+    suffix = f" ({', '.join(details)})" if details else ""
+    writer.write(f"{prefix}- **{issue['key']}** - {issue['summary']}{suffix}\n")
+
+
+# Board table of a render worker process, memory mapped once per process
+_worker_table = None
+
+
+def _init_render_worker(table_path):
+    global _worker_table
+    _worker_table = ipc.open_file(pa.memory_map(table_path)).read_all()
+
+
+def _render_team_file(file_path, team, contacts, updated_plan, not_updated_plan, compaction):
+    """Process pool task: take only the rows this team renders from the shared board"""
+    positions = sorted({position for plan in (updated_plan, not_updated_plan) if plan for position, _ in plan})
+    frame = _worker_table.take(positions).to_pandas()
+    # Arrow nulls come back as None in text columns, the serial path renders them as NaN
+    for column in frame.select_dtypes(include='object'):
+        frame[column] = frame[column].where(frame[column].notna(), np.nan)
+    rows = frame.to_dict('records')
+    return _write_team_file(file_path, team, contacts, updated_plan, not_updated_plan, compaction,
+                            dict(zip(positions, rows)))
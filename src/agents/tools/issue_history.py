@@ -0,0 +1,85 @@
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field, ConfigDict
+from src.storage.issue_history import IssueHistoryDB
+from typing import Optional
+import os
+
+class JiraIssueHistorySchema(BaseModel):
+    """Schema for JiraIssueHistory inputs"""
+    action: str = Field(description="Action to perform. Possible actions: list_snapshots, stale_issues, issue_timeline, status_counts, query")
+    database_path: str = Field(default="jira-weekly-data/issue-history.sqlite", description="Path of the issue history database")
+    project_id: str = Field(default=None, description="Only use the snapshots of this project")
+    team: str = Field(default=None, description="Only use the issues of this team")
+    weeks: int = Field(default=3, description="For stale_issues: consecutive weekly snapshots without updates")
+    as_of: str = Field(default=None, description="For stale_issues: ignore the snapshots after this date (YYYY-MM-DD)")
+    issue_key: str = Field(default=None, description="For issue_timeline: key of the issue")
+    start_week: str = Field(default=None, description="For status_counts: first week (YYYY-WNN)")
+    end_week: str = Field(default=None, description="For status_counts: last week (YYYY-WNN)")
+    sql: str = Field(default=None, description="For query: read-only SELECT over the tables snapshots(id, project, snapshot_date, week, issues) and issue_snapshots(snapshot_id, key, summary, status, team, teams, workstream, parent_issue, last_update, last_comment_date)")
+
+class JiraIssueHistory(BaseTool):
+    name: str = "JiraIssueHistory"
+    description: str = "Query the history of the board issues across the weekly extractions"
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    args_schema: type[BaseModel] = JiraIssueHistorySchema
+    database_path: str = Field(default="jira-weekly-data/issue-history.sqlite", description="Path of the issue history database")
+    max_rows: int = Field(default=200, description="Rows returned to the agent, the rest are counted")
+    history: Optional[IssueHistoryDB] = Field(default=None, description="Database opened by the running action")
+
+    def _run(self, action: str, database_path: str = "jira-weekly-data/issue-history.sqlite", project_id: str = None,
+             team: str = None, weeks: int = 3, as_of: str = None, issue_key: str = None, start_week: str = None,
+             end_week: str = None, sql: str = None) -> str:
+        """
+        Execute issue history actions
+        """
+        self.database_path = database_path
+        actions = {
+            "list_snapshots": lambda: self.list_snapshots(project_id),
+            "stale_issues": lambda: self.stale_issues(weeks, project_id, team, as_of),
+            "issue_timeline": lambda: self.issue_timeline(issue_key),
+            "status_counts": lambda: self.status_counts(project_id, team, start_week, end_week),
+            "query": lambda: self.query(sql),
+        }
+        if action not in actions:
+            return f"Invalid action. Available actions: {list(actions.keys())}"
+        if not os.path.exists(self.database_path):
+            return f"Issue history database not found: {self.database_path}. It is created by the data extraction"
+        with IssueHistoryDB(self.database_path) as history:
+            self.history = history
+            try:
+                return actions[action]()
+            finally:
+                self.history = None
+
+    def list_snapshots(self, project_id=None) -> str:
+        return self.__to_text(self.history.snapshots(project_id), "No snapshots stored yet.")
+
+    def stale_issues(self, weeks=3, project_id=None, team=None, as_of=None) -> str:
+        """Open issues without updates in the last `weeks` weekly snapshots"""
+        return self.__to_text(self.history.stale_issues(weeks, project_id, team, as_of),
+                              f"No issues stale for {weeks} consecutive weeks.")
+
+    def issue_timeline(self, issue_key) -> str:
+        if not issue_key:
+            return "issue_key is required for issue_timeline"
+        return self.__to_text(self.history.issue_timeline(issue_key), f"Issue {issue_key} not found in the history.")
+
+    def status_counts(self, project_id=None, team=None, start_week=None, end_week=None) -> str:
+        return self.__to_text(self.history.status_counts(project_id, team, start_week, end_week),
+                              "No snapshots in the requested weeks.")
+
+    def query(self, sql) -> str:
+        if not sql or not sql.lstrip().lower().startswith(("select", "with")):
+            return "Only SELECT queries are allowed"
+        try:
+            return self.__to_text(self.history.query(sql), "The query returned no rows.")
+        except Exception as e:
+            return f"Query failed: {str(e)}"
+
+    def __to_text(self, df, empty_message) -> str:
+        if df.empty:
+            return empty_message
+        text = df.head(self.max_rows).to_csv(index=False)
+        if len(df) > self.max_rows:
+            text += f"... {len(df) - self.max_rows} more rows"
+        return text
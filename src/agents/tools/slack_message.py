@@ -1,6 +1,8 @@
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field, ConfigDict
-from slack_sdk import WebClient
+from src.connection.slack_delivery import SlackDelivery
+from src.storage.delivery_ledger import DeliveryLedger, ledger_path
+from src.utils.slack_packing import fit_sections, plan_team_messages, validate_message
 from slack_sdk.errors import SlackApiError
 from typing import Dict, Any
 import os
@@ -12,6 +14,8 @@ class SlackMessageSchema(BaseModel):
     channel_id: str = Field(default=None, description="Slack channel ID to send the message to")
     report_data: Dict[str, Any] = Field(default=None, description="For send_message: path to the consolidated report file. For consolidate_report: dictionary with report paths and output path")
     report_file_path: str = Field(default=None, description="Path to the JSON file containing the report data to be sent to Slack")
+    preserve_order: bool = Field(default=False, description="Post the team updates one by one so the thread keeps the report's team order. By default they are posted concurrently")
+    max_concurrency: int = Field(default=4, description="Team updates posted at the same time")
 
 class SlackMessage(BaseTool):
     name: str = "SlackMessage"
@@ -21,31 +25,41 @@ class SlackMessage(BaseTool):
     channel_id: str = Field(default=None, description="Slack channel ID to send the message to")
     report_data: Dict[str, Any] = Field(default=None, description="For send_message: path to the consolidated report file. For consolidate_report: dictionary with report paths and output path")
     report_file_path: str = Field(default=None, description="Path to the JSON file containing the report data to be sent to Slack")
+    base_url: str = Field(default=None, description="Slack Web API URL, e.g. a local fake server. Defaults to SLACK_API_URL or https://slack.com/api/")
 
 
-    def _run(self, action: str, channel_id: str, report_data: Dict[str, Any], report_file_path: str) -> str:
+    def _run(self, action: str, channel_id: str, report_data: Dict[str, Any], report_file_path: str,
+             preserve_order: bool = False, max_concurrency: int = 4) -> str:
         """
         Execute Slack message actions
         """
         actions = {
-            "send_message": lambda: self.send_message(channel_id, report_file_path),
+            "send_message": lambda: self.send_message(channel_id, report_file_path, preserve_order, max_concurrency),
             "consolidate_report": lambda: self.consolidate_report(report_data),
         }
         if action not in actions:
             return f"Invalid action. Available actions: {list(actions.keys())}"
         return actions[action]()
 
-    def send_message(self, channel_id: str, report_file_path: str) -> Dict:
+    def send_message(self, channel_id: str, report_file_path: str, preserve_order: bool = False,
+                     max_concurrency: int = 4) -> Dict:
         """
         Posts a report to Slack with:
         1. Work Evolution Overview
         2. Workstreams Overview
         3. Team-wise Updates header
-        4. Individual team updates in separate threads
+        4. Team updates in the thread, packed into the fewest messages within Slack's block and size limits
+
+        The team updates are thread replies posted concurrently under the channel's rate budget,
+        rate limited messages are retried after their Retry-After (see SlackDelivery). The posted messages
+        are recorded in a ledger next to the report file: running it again for the same window skips what
+        was delivered, updates the messages whose content changed and resumes an interrupted delivery.
 
         Args:
             channel_id: Slack channel ID
             report_file_path: Path to the consolidated report JSON file
+            preserve_order: Post the team updates one by one, in the report's team order
+            max_concurrency: Team updates posted at the same time
         """
         # Read the report data from file
         with open(report_file_path, 'r') as f:
@@ -55,8 +69,6 @@ class SlackMessage(BaseTool):
         if not slack_token:
             raise ValueError("SLACK_BOT_TOKEN environment variable not set")
 
-        client = WebClient(token=slack_token)
-
         # Blocks for the Work Evolution Overview
         overview_blocks = [
             {
@@ -153,79 +165,42 @@ class SlackMessage(BaseTool):
         }
         ]
 
+        # Team updates packed into the fewest thread replies within Slack's size limits, checked before posting
+        messages = plan_team_messages(report_data['teams'])
+        overview_blocks = fit_sections(overview_blocks)
+        for blocks in (overview_blocks, team_header_blocks):
+            validate_message(blocks)
+        # Continuations of a team split over several messages must follow its previous message
+        chained = [position > 0 and message["teams"][0] == messages[position - 1]["teams"][-1]
+                   for position, message in enumerate(messages)]
+
+        # Messages already posted for this window are recorded next to the report, a re-run only sends what changed
+        ledger = DeliveryLedger(ledger_path(report_file_path))
+        delivery = SlackDelivery(slack_token, base_url=self.base_url, max_concurrency=max_concurrency, ledger=ledger)
         try:
-            # Send the overview message
-            overview_response = client.chat_postMessage(
-                channel=channel_id,
-                blocks=overview_blocks
-            )
-
-            # Send the team updates header
-            team_header_response = client.chat_postMessage(
-                channel=channel_id,
-                blocks=team_header_blocks,
-                thread_ts=overview_response["ts"]
-            )
-
-            # Send individual team updates in the thread
-            team_responses = []
-            for team in report_data['teams']:
-                team_blocks = [
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": f"*{team['name']}:*\nPoints of contact: {', '.join(team['contacts'])}"
-                        }
-                    }
-                ]
-
-                # Add updated issues
-                if team['updated_issues']:
-                    for issue in team['updated_issues']:
-                        issue_text = f"• <{issue['url']}|*{issue['id']}*> - {issue['title']}"
-                        if issue.get('fup'):
-                            issue_text += f"\n> {issue['fup']}"
-
-                        team_blocks.append({
-                            "type": "section",
-                            "text": {
-                                "type": "mrkdwn",
-                                "text": issue_text
-                            }
-                        })
-
-                # Add non-updated issues
-                if team['no_update_issues']:
-                    for issue in team['no_update_issues']:
-                        issue_text = f"• <{issue['url']}|*{issue['id']}*> - {issue['title']}"
-                        if issue.get('fup'):
-                            issue_text += f"\n> {issue['fup']}"
-
-                        team_blocks.append({
-                            "type": "section",
-                            "text": {
-                                "type": "mrkdwn",
-                                "text": issue_text
-                            }
-                        })
-
-                # Send team update in the thread
-                team_response = client.chat_postMessage(
-                    channel=channel_id,
-                    blocks=team_blocks,
-                    thread_ts=overview_response["ts"]
-                )
-                team_responses.append(team_response)
-
-            return {
-                "overview_response": overview_response,
-                "team_header_response": team_header_response,
-                "team_responses": team_responses
-            }
-
+            overview_response, team_header_response, team_responses = delivery.post_report(
+                channel_id, overview_blocks, team_header_blocks, [message["blocks"] for message in messages],
+                preserve_order=preserve_order, chained=chained, teams=[message["teams"] for message in messages],
+                window=f"{report_data['start_date']}_to_{report_data['end_date']}")
         except SlackApiError as e:
-            return {"error": str(e.response["error"])}
+            return {"error": _slack_error(e)}
+
+        # A failed message doesn't stop the others, the teams it carried are reported with its error
+        failed_teams = {}
+        for message, response in zip(messages, team_responses):
+            if isinstance(response, Exception):
+                error = _slack_error(response) if isinstance(response, SlackApiError) else str(response)
+                failed_teams.update((team, error) for team in message["teams"])
+        result = {
+            "overview_response": overview_response,
+            "team_header_response": team_header_response,
+            "team_responses": [response for response in team_responses if not isinstance(response, Exception)],
+            "skipped_messages": sum(isinstance(response, dict) and response.get("skipped", False)
+                                    for response in [overview_response, team_header_response, *team_responses])
+        }
+        if failed_teams:
+            result["failed_teams"] = failed_teams
+        return result
 
     def consolidate_report(self, report_data: Dict[str, Any]) -> str:
         """
@@ -264,4 +239,11 @@ class SlackMessage(BaseTool):
         with open(report_data['output_path'], 'w') as f:
             json.dump(teams_report, f, indent=4)
 
-        return report_data['output_path']
\ No newline at end of file
+        return report_data['output_path']
+
+
+def _slack_error(error: SlackApiError) -> str:
+    """Slack error code of the response, or the whole error when the body isn't a Slack JSON answer"""
+    if isinstance(error.response.data, dict):
+        return str(error.response["error"])
+    return str(error)
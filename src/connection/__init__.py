@@ -1,4 +1,8 @@
 """Connection management module for Jira API"""
 from .jira_connection import JiraConnectionManager
+from .async_jira_connection import AsyncJiraConnectionManager
+from .rate_limiter import JiraRateLimiter
+from .response_cache import JiraResponseCache
+from .slack_delivery import SlackDelivery
 
-__all__ = ["JiraConnectionManager"]
+__all__ = ["JiraConnectionManager", "AsyncJiraConnectionManager", "JiraRateLimiter", "JiraResponseCache", "SlackDelivery"]
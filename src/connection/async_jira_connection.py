@@ -0,0 +1,244 @@
+import aiohttp
+import asyncio
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .jira_connection import JiraErrorHandler, JiraLogger, TimeoutConfig
+from .rate_limiter import JiraRateLimiter
+from .response_cache import JiraResponseCache
+
+
+class JiraAsyncResponse:
+    """Fully read response returned by AsyncJiraConnectionManager.
+
+    Mirrors the parts of requests.Response used by the tools (status_code,
+    headers, text and json()) so callers can switch managers transparently.
+    """
+
+    def __init__(self, status_code: int, headers: Dict[str, str], content: bytes, url: str = ""):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class JiraAsyncHTTPError(Exception):
+    """Raised when Jira answers with a non-success status code"""
+
+    def __init__(self, response: JiraAsyncResponse):
+        super().__init__(f"{response.status_code} error for url: {response.url}")
+        self.response = response
+
+
+class AsyncJiraConnectionManager:
+    """asyncio based counterpart of JiraConnectionManager.
+
+    Uses the same environment variables, TimeoutConfig and JiraErrorHandler
+    retry rules, but issues requests concurrently over a single keep-alive
+    connection pool. At most `max_concurrency` requests are in flight at once,
+    and a JiraRateLimiter (which can be shared with a JiraConnectionManager)
+    paces them and pauses all of them when Jira starts rate limiting.
+
+    The manager owns a private event loop running on a daemon thread, so
+    synchronous code (crewAI tools, notebooks with a running loop) can use
+    `request` and `request_many` without managing a loop themselves.
+    """
+
+    def __init__(self, max_concurrency: int = 10, keepalive_timeout: int = 30,
+                 rate_limiter: Optional[JiraRateLimiter] = None,
+                 response_cache: Optional[JiraResponseCache] = None):
+        self.timeout_config = TimeoutConfig()
+        self.response_cache = response_cache  # Opt-in persistent cache for GET requests
+        self.rate_limiter = rate_limiter or JiraRateLimiter(max_concurrency=max_concurrency)
+        self.error_handler = JiraErrorHandler(self.rate_limiter)
+        self.error_handler.retryable_errors += (aiohttp.ClientError, asyncio.TimeoutError, JiraAsyncHTTPError)
+        self.logger = JiraLogger().logger
+        self.max_concurrency = max_concurrency
+        self.keepalive_timeout = keepalive_timeout
+        self.base_url = os.getenv('JIRA_URL')
+        self.auth = aiohttp.BasicAuth(
+            os.getenv('JIRA_USERNAME') or '',
+            os.getenv('JIRA_API_TOKEN') or ''
+        )
+        self._validate_config()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._lock = threading.Lock()
+
+    def _validate_config(self):
+        required_vars = ['JIRA_URL', 'JIRA_USERNAME', 'JIRA_API_TOKEN']
+        missing = [var for var in required_vars if not os.getenv(var)]
+        if missing:
+            raise ValueError(f"Missing required environment variables: {missing}")
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop on first use"""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="jira-async-connection",
+                    daemon=True
+                )
+                self._thread.start()
+        return self._loop
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Create the shared session and connection pool inside the running loop"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            timeout = aiohttp.ClientTimeout(
+                sock_connect=self.timeout_config.connect_timeout,
+                sock_read=self.timeout_config.read_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                auth=self.auth,
+                raise_for_status=False
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    @staticmethod
+    def _encode_params(params: Optional[Dict[str, Any]]) -> Optional[List[Tuple[str, str]]]:
+        """Encode params the way requests does (lists become repeated keys)"""
+        if params is None:
+            return None
+        encoded = []
+        for key, value in params.items():
+            values = value if isinstance(value, (list, tuple)) else [value]
+            for item in values:
+                if isinstance(item, bool):
+                    item = str(item).lower()
+                encoded.append((key, str(item)))
+        return encoded
+
+    async def make_request(self, method: str, endpoint: str, **kwargs) -> JiraAsyncResponse:
+        """Send a request on the manager loop, retrying like JiraConnectionManager.make_request"""
+        session = await self._get_session()
+        url = f"{self.base_url}{endpoint}"
+
+        # Serve GET requests from the response cache, revalidating stale entries with Jira
+        cache_key, cached = None, None
+        if self.response_cache is not None and method.upper() == "GET":
+            cache_key = self.response_cache.make_key(method, url, kwargs.get('params'))
+            cached = self.response_cache.get(cache_key)
+            if cached is not None and self.response_cache.is_fresh(cached):
+                self.response_cache.hits += 1
+                return JiraAsyncResponse(cached.status_code, cached.headers, cached.content, cached.url)
+            if cached is not None:
+                kwargs['headers'] = {**(kwargs.get('headers') or {}), **self.response_cache.conditional_headers(cached)}
+
+        if 'params' in kwargs:
+            kwargs['params'] = self._encode_params(kwargs['params'])
+        retry_count = 0
+
+        while True:
+            async with self._semaphore:
+                await self.rate_limiter.acquire_async()
+                response = None
+                try:
+                    async with session.request(method=method, url=url, **kwargs) as raw:
+                        response = JiraAsyncResponse(
+                            status_code=raw.status,
+                            headers=raw.headers.copy(),
+                            content=await raw.read(),
+                            url=str(raw.url)
+                        )
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    error = e
+                finally:
+                    self.rate_limiter.release(
+                        response.status_code if response is not None else None,
+                        response.headers if response is not None else None
+                    )
+
+            if response is not None:
+                if response.status_code == 304 and cached is not None:
+                    self.response_cache.revalidated += 1
+                    self.response_cache.touch(cache_key)
+                    return JiraAsyncResponse(cached.status_code, cached.headers, cached.content, cached.url)
+                if response.status_code < 400:
+                    if cache_key is not None:
+                        self.response_cache.misses += 1
+                        self.response_cache.put(cache_key, url, response.status_code, response.headers, response.content)
+                    return response
+                error = JiraAsyncHTTPError(response)
+                # Don't retry client errors (4xx), except rate limiting
+                if 400 <= response.status_code < 500 and response.status_code != 429:
+                    self.logger.error(f"Client error {response.status_code}: {str(error)}")
+                    raise error
+
+            if not self.error_handler.handle_request_error(error, retry_count):
+                self.logger.error(f"Request failed after {retry_count} retries: {str(error)}")
+                raise error
+            # Jittered backoff only delays this request, other tasks keep going
+            await asyncio.sleep(self.error_handler.get_retry_delay(error, retry_count))
+            retry_count += 1
+
+    async def _make_many(self, calls: Iterable[Tuple[str, str, Dict[str, Any]]]) -> List[Any]:
+        return await asyncio.gather(
+            *(self.make_request(method, endpoint, **kwargs) for method, endpoint, kwargs in calls),
+            return_exceptions=True
+        )
+
+    def run(self, coro):
+        """Run a coroutine on the manager loop and block until it finishes"""
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def request(self, method: str, endpoint: str, **kwargs) -> JiraAsyncResponse:
+        """Blocking helper around make_request"""
+        return self.run(self.make_request(method, endpoint, **kwargs))
+
+    def request_many(self, calls: Iterable[Tuple[str, str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Send (method, endpoint, kwargs) calls concurrently and return the
+        responses in call order. Failed calls yield their exception instead of
+        a response, so one bad issue does not abort the whole batch.
+        """
+        return self.run(self._make_many(list(calls)))
+
+    async def _close_session(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    def close(self):
+        """Close the connection pool and stop the background loop"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop, self._thread = None, None
+        if loop is None or loop.is_closed():
+            return
+        asyncio.run_coroutine_threadsafe(self._close_session(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join()
+        loop.close()
+        self._session = None
+        self._semaphore = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
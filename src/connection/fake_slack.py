@@ -0,0 +1,123 @@
+"""Local stand-in for the Slack Web API used by SlackDelivery"""
+from aiohttp import web
+import asyncio
+import itertools
+import threading
+import time
+
+
+class FakeSlackServer:
+    """
+    Minimal Slack Web API serving chat.postMessage, chat.update and chat.delete on localhost, so SlackDelivery
+    can run without network access.
+
+    Posted messages are kept in `messages` in arrival order. Every `rate_limit_every`-th request is answered with
+    a 429 `ratelimited` error and a Retry-After of `retry_after` seconds, and `latency` delays every answer,
+    to exercise the rate budget and the concurrent posting.
+
+        with FakeSlackServer(rate_limit_every=5) as server:
+            SlackDelivery("xoxb-fake", base_url=server.base_url).post_report(...)
+    """
+
+    def __init__(self, rate_limit_every: int = 0, retry_after: int = 1, latency: float = 0.0):
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+        self.latency = latency
+        self.messages = []
+        self.requests = 0
+        self.rate_limited = 0
+        self.posted = self.updated = self.deleted = 0
+        self.base_url = None
+        self._ts = itertools.count(1)
+        self._loop = None
+        self._thread = None
+        self._runner = None
+
+    async def _read(self, request):
+        """Payload of a request, or the error response to answer with"""
+        self.requests += 1
+        if self.rate_limit_every and self.requests % self.rate_limit_every == 0:
+            self.rate_limited += 1
+            return None, web.json_response({"ok": False, "error": "ratelimited"}, status=429,
+                                           headers={"Retry-After": str(self.retry_after)})
+        if not request.headers.get("Authorization", "").startswith("Bearer "):
+            return None, web.json_response({"ok": False, "error": "not_authed"})
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if request.content_type == "application/json":
+            return await request.json(), None
+        # Methods without blocks (chat.delete) send form or query parameters
+        return {**request.query, **(await request.post())}, None
+
+    def _find(self, ts):
+        return next((message for message in self.messages if message["ts"] == ts), None)
+
+    async def _post_message(self, request):
+        payload, error = await self._read(request)
+        if error is not None:
+            return error
+        message = {"ts": f"{int(time.time())}.{next(self._ts):06d}", **payload}
+        self.messages.append(message)
+        self.posted += 1
+        return web.json_response({"ok": True, "channel": payload.get("channel"), "ts": message["ts"],
+                                  "message": message})
+
+    async def _update(self, request):
+        payload, error = await self._read(request)
+        if error is not None:
+            return error
+        message = self._find(payload.get("ts"))
+        if message is None:
+            return web.json_response({"ok": False, "error": "message_not_found"})
+        message.update(payload)
+        self.updated += 1
+        return web.json_response({"ok": True, "channel": payload.get("channel"), "ts": message["ts"]})
+
+    async def _delete(self, request):
+        payload, error = await self._read(request)
+        if error is not None:
+            return error
+        message = self._find(payload.get("ts"))
+        if message is None:
+            return web.json_response({"ok": False, "error": "message_not_found"})
+        self.messages.remove(message)
+        self.deleted += 1
+        return web.json_response({"ok": True, "channel": payload.get("channel"), "ts": message["ts"]})
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_post("/api/chat.postMessage", self._post_message)
+        app.router.add_post("/api/chat.update", self._update)
+        app.router.add_post("/api/chat.delete", self._delete)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, "127.0.0.1", 0).start()
+        host, port = self._runner.addresses[0][:2]
+        return f"http://{host}:{port}/api/"
+
+    def start(self):
+        """Serve on a random local port from a background thread and return the base_url"""
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="fake-slack", daemon=True)
+        self._thread.start()
+        self.base_url = asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+        return self.base_url
+
+    def stop(self):
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+
+    def thread_replies(self, thread_ts):
+        return [message for message in self.messages if message.get("thread_ts") == thread_ts]
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
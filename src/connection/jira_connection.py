@@ -1,16 +1,23 @@
 import requests
 from requests.adapters import HTTPAdapter, Retry
 from requests.auth import HTTPBasicAuth
+from requests.structures import CaseInsensitiveDict
 from typing import Optional, Dict, Any
 import os
 from datetime import datetime
 import logging
 import time
 
+from .rate_limiter import JiraRateLimiter
+from .response_cache import CachedResponse, JiraResponseCache
+
 class JiraConnectionManager:
-    def __init__(self):
+    def __init__(self, rate_limiter: Optional[JiraRateLimiter] = None,
+                 response_cache: Optional[JiraResponseCache] = None):
         self.timeout_config = TimeoutConfig()
-        self.error_handler = JiraErrorHandler()
+        self.rate_limiter = rate_limiter or JiraRateLimiter()
+        self.response_cache = response_cache  # Opt-in persistent cache for GET requests
+        self.error_handler = JiraErrorHandler(self.rate_limiter)
         self._setup_logging()
         self.logger = JiraLogger().logger
         self.session = self._create_session()
@@ -57,7 +64,22 @@ class JiraConnectionManager:
         url = f"{self.base_url}{endpoint}"
         retry_count = 0
 
-        while retry_count < self.timeout_config.max_retries:
+        # Serve GET requests from the response cache, revalidating stale entries with Jira
+        cache_key, cached = None, None
+        if self.response_cache is not None and method.upper() == "GET":
+            cache_key = self.response_cache.make_key(method, url, kwargs.get('params'))
+            cached = self.response_cache.get(cache_key)
+            if cached is not None and self.response_cache.is_fresh(cached):
+                self.response_cache.hits += 1
+                return self._cached_response(cached)
+            if cached is not None:
+                kwargs['headers'] = {**(kwargs.get('headers') or {}), **self.response_cache.conditional_headers(cached)}
+
+        while True:
+            # Wait for the shared limiter, so a throttled request pauses every thread using this connection
+            self.rate_limiter.acquire()
+            response = None
+            error = None
             try:
                 response = self.session.request(
                     method=method,
@@ -67,38 +89,59 @@ class JiraConnectionManager:
                             self.timeout_config.read_timeout),
                     **kwargs
                 )
+                if response.status_code == 304 and cached is not None:
+                    self.response_cache.revalidated += 1
+                    self.response_cache.touch(cache_key)
+                    return self._cached_response(cached)
                 response.raise_for_status()
+                if cache_key is not None:
+                    self.response_cache.misses += 1
+                    self.response_cache.put(cache_key, url, response.status_code, response.headers, response.content)
                 return response
 
             except requests.exceptions.HTTPError as e:
-                # Don't retry client errors (4xx)
-                if 400 <= e.response.status_code < 500:
+                error = e
+                # Don't retry client errors (4xx), except rate limiting
+                if 400 <= e.response.status_code < 500 and e.response.status_code != 429:
                     self.logger.error(f"Client error {e.response.status_code}: {str(e)}")
                     raise
-                # Only retry server errors (5xx)
-                if self.error_handler.handle_request_error(e, retry_count):
-                    retry_count += 1
-                    continue
-                self.logger.error(f"Request failed after {retry_count} retries: {str(e)}")
-                raise
+                if not self.error_handler.handle_request_error(e, retry_count):
+                    self.logger.error(f"Request failed after {retry_count} retries: {str(e)}")
+                    raise
             except requests.exceptions.RequestException as e:
-                if self.error_handler.handle_request_error(e, retry_count):
-                    retry_count += 1
-                    continue
-                self.logger.error(f"Request failed after {retry_count} retries: {str(e)}")
-                raise
+                error = e
+                if not self.error_handler.handle_request_error(e, retry_count):
+                    self.logger.error(f"Request failed after {retry_count} retries: {str(e)}")
+                    raise
+            finally:
+                self.rate_limiter.release(
+                    response.status_code if response is not None else None,
+                    response.headers if response is not None else None
+                )
+
+            # Jittered backoff only delays this request, other threads keep going
+            time.sleep(self.error_handler.get_retry_delay(error, retry_count))
+            retry_count += 1
+
+    @staticmethod
+    def _cached_response(cached: CachedResponse) -> requests.Response:
+        """Build a requests.Response from a cached entry"""
+        response = requests.Response()
+        response.status_code = cached.status_code
+        response.headers = CaseInsensitiveDict(cached.headers)
+        response._content = cached.content
+        response.url = cached.url
+        response.encoding = 'utf-8'
+        return response
 
     def _configure_connection_pool(self):
         '''Configure connection pooling for the session'''
         adapter = HTTPAdapter(
             pool_connections=100,  # Number of connection pools to cache
             pool_maxsize=100,     # Maximum number of connections to save in the pool
-            max_retries=Retry(
-                total=5,
-                backoff_factor=1,
-                status_forcelist=[408, 429, 500, 502, 503, 504],
-                allowed_methods=["HEAD", "GET", "POST", "PUT", "DELETE", "OPTIONS", "TRACE"]
-            )
+            # No retries at the urllib3 layer, make_request and JiraErrorHandler own every retry (connects included)
+            # under the shared rate limiter, so the two layers never multiply their attempts
+            max_retries=Retry(0)
         )
         return adapter
 
@@ -118,33 +161,40 @@ class TimeoutConfig:
 
 
 class JiraErrorHandler:
-    def __init__(self):
+    def __init__(self, rate_limiter: Optional[JiraRateLimiter] = None):
         self.max_retries = 3
-        self.backoff_base = 30
-        self.max_backoff = 300
+        self.backoff_base = 1
+        self.max_backoff = 30
+        self.rate_limiter = rate_limiter or JiraRateLimiter()
+        self.retryable_errors = (requests.exceptions.Timeout,
+                                requests.exceptions.ConnectionError,
+                                requests.exceptions.HTTPError)
 
     def handle_request_error(self, error, retry_count=0):
-        """Handle request errors with exponential backoff"""
+        """Decide if a failed request should be retried, reporting rate limits to the shared limiter"""
         if retry_count >= self.max_retries:
             return False
 
-        if isinstance(error, (requests.exceptions.Timeout,
-                            requests.exceptions.ConnectionError,
-                            requests.exceptions.HTTPError)):
-            if hasattr(error, 'response') and error.response.status_code == 429:
-                # Handle rate limiting specifically
-                retry_after = int(error.response.headers.get('Retry-After', self.backoff_base))
-                time.sleep(retry_after)
-                return True
-
-            time.sleep(self.get_backoff_time(retry_count))  # Changed from _calculate_backoff
+        if isinstance(error, self.retryable_errors):
+            response = getattr(error, 'response', None)
+            if response is not None and response.status_code == 429:
+                # Handle rate limiting globally: Retry-After pauses the whole connection
+                retry_after = self.rate_limiter.parse_retry_after(response.headers.get('Retry-After'))
+                if retry_after is None:
+                    self.rate_limiter.pause(self.get_backoff_time(retry_count))
             return True
         return False
 
+    def get_retry_delay(self, error, retry_count=0):
+        """Delay before retrying this request only. Rate limited requests wait on the limiter instead"""
+        response = getattr(error, 'response', None)
+        if response is not None and response.status_code == 429:
+            return 0
+        return self.get_backoff_time(retry_count)
+
     def get_backoff_time(self, retry_count):  # Changed from _calculate_backoff
-        """Calculate exponential backoff time"""
-        backoff = min(self.max_backoff, self.backoff_base * (2 ** retry_count))
-        return backoff
+        """Calculate exponential backoff time with full jitter"""
+        return self.rate_limiter.backoff_time(retry_count, self.backoff_base, self.max_backoff)
 
 
 class JiraLogger:
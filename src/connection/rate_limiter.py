@@ -0,0 +1,151 @@
+import asyncio
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+
+class JiraRateLimiter:
+    """Token bucket with an adaptive concurrency limit, shared by every thread or task of a connection.
+
+    Requests take a token and a concurrency slot before being sent. Rate limit
+    answers from Jira (Retry-After, X-RateLimit-* headers) pause new requests
+    globally instead of per call, while requests already in flight finish normally.
+    The concurrency limit grows by one slot per successful window and halves on
+    throttling (AIMD).
+    """
+
+    def __init__(self, rate: float = 10.0, burst: int = 20, max_concurrency: int = 20,
+                 min_concurrency: int = 1, poll_interval: float = 0.05):
+        self.rate = rate                        # Tokens added per second
+        self.burst = burst                      # Bucket size
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.poll_interval = poll_interval
+
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._concurrency_limit = float(max_concurrency)
+        self._in_flight = 0
+
+    @property
+    def concurrency_limit(self) -> int:
+        return max(self.min_concurrency, int(self._concurrency_limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _reserve(self) -> float:
+        """Take a token and a slot if possible, otherwise return how long to wait"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+
+            if self._paused_until > now:
+                return self._paused_until - now
+            if self._in_flight >= self.concurrency_limit:
+                return self.poll_interval
+            if self._tokens < 1:
+                return (1 - self._tokens) / self.rate
+
+            self._tokens -= 1
+            self._in_flight += 1
+            return 0.0
+
+    def acquire(self):
+        """Block the calling thread until a request may be sent"""
+        while True:
+            wait = self._reserve()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Wait without blocking the event loop until a request may be sent"""
+        while True:
+            wait = self._reserve()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def release(self, status_code: Optional[int] = None, headers: Optional[Mapping[str, str]] = None):
+        """Free the slot taken by acquire and adapt to the response received"""
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+            if status_code is not None and status_code < 400:
+                # Additive increase: roughly one extra slot per window of successful requests
+                self._concurrency_limit = min(
+                    self.max_concurrency,
+                    self._concurrency_limit + 1 / max(1.0, self._concurrency_limit)
+                )
+            elif status_code in (429, 503):
+                self._concurrency_limit = max(self.min_concurrency, self._concurrency_limit / 2)
+
+        if headers:
+            self.update_from_headers(headers)
+
+    def pause(self, seconds: float):
+        """Stop every new request from being sent for the next `seconds`"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def update_from_headers(self, headers: Mapping[str, str]):
+        """Apply Retry-After and Atlassian rate limit headers to the whole connection"""
+        retry_after = self.parse_retry_after(headers.get('Retry-After'))
+        if retry_after is not None:
+            self.pause(retry_after)
+
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = self._seconds_until(headers.get('X-RateLimit-Reset'))
+        if remaining is not None and reset is not None:
+            try:
+                if int(remaining) <= 0:
+                    self.pause(reset)
+            except ValueError:
+                pass
+
+        if str(headers.get('X-RateLimit-NearLimit', '')).lower() == 'true':
+            # Slow down before Jira starts answering with 429
+            with self._lock:
+                self._concurrency_limit = max(self.min_concurrency, self._concurrency_limit * 0.75)
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Retry-After can be a number of seconds or an HTTP date"""
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    @staticmethod
+    def _seconds_until(value: Optional[str]) -> Optional[float]:
+        """X-RateLimit-Reset is sent by Jira Cloud as an ISO 8601 timestamp"""
+        if not value:
+            return None
+        try:
+            reset_at = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+        if reset_at.tzinfo is None:
+            reset_at = reset_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+
+    @staticmethod
+    def backoff_time(retry_count: int, base: float, cap: float) -> float:
+        """Exponential backoff with full jitter so retries from many workers don't line up"""
+        return random.uniform(0, min(cap, base * (2 ** retry_count)))
@@ -0,0 +1,156 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+
+
+class CachedResponse:
+    """A response stored in the JiraResponseCache"""
+
+    def __init__(self, key: str, url: str, status_code: int, headers: Dict[str, str], content: bytes,
+                 stored_at: float):
+        self.key = key
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.stored_at = stored_at
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get('ETag') or self.headers.get('etag')
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get('Last-Modified') or self.headers.get('last-modified')
+
+
+class JiraResponseCache:
+    """Persistent SQLite cache for Jira GET responses.
+
+    Entries are keyed by method, URL and query params. Entries younger than `ttl`
+    seconds are served without any request; older ones are revalidated with
+    If-None-Match / If-Modified-Since when Jira sent an ETag or Last-Modified
+    header. The least recently used entries are evicted once the stored bodies
+    exceed `max_bytes`.
+    """
+
+    def __init__(self, path: str = "jira-weekly-data/.http-cache.sqlite", ttl: int = 6 * 3600,
+                 max_bytes: int = 256 * 1024 * 1024):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+        self._db.commit()
+
+    @staticmethod
+    def make_key(method: str, url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """Stable key for a request. Param names are sorted, list values keep their order"""
+        encoded = []
+        for name in sorted(params or {}):
+            value = params[name]
+            values = value if isinstance(value, (list, tuple)) else [value]
+            encoded.append([name, [str(item) for item in values]])
+        raw = json.dumps([method.upper(), url, encoded], separators=(',', ':'))
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the stored response and mark it as recently used"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT url, status, headers, body, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+
+        url, status, headers, body, stored_at = row
+        entry = CachedResponse(key, url, status, json.loads(headers), body, stored_at)
+        if not self.is_fresh(entry) and not (entry.etag or entry.last_modified):
+            # Expired and nothing to revalidate with
+            self.delete(key)
+            return None
+        return entry
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        return time.time() - entry.stored_at < self.ttl
+
+    def conditional_headers(self, entry: CachedResponse) -> Dict[str, str]:
+        """Headers asking Jira to answer 304 if the stored response is still valid"""
+        headers = {}
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def put(self, key: str, url: str, status_code: int, headers: Mapping[str, str], content: bytes):
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, url, status, headers, body, size, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, status_code, json.dumps(dict(headers)), content, len(content), now, now)
+            )
+            self._evict()
+            self._db.commit()
+
+    def touch(self, key: str):
+        """Restart the TTL of an entry Jira confirmed with a 304"""
+        now = time.time()
+        with self._lock:
+            self._db.execute("UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?", (now, now, key))
+            self._db.commit()
+
+    def delete(self, key: str):
+        with self._lock:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._db.commit()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes. Caller holds the lock"""
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = []
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def summary(self) -> str:
+        return f"response cache: {self.hits} hits, {self.revalidated} revalidated, {self.misses} misses"
@@ -0,0 +1,245 @@
+import aiohttp
+import asyncio
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
+
+from src.storage.delivery_ledger import DeliveryLedger, content_hash
+from .rate_limiter import JiraRateLimiter
+
+SLACK_API_URL = "https://slack.com/api/"
+
+
+class SlackDelivery:
+    """Concurrent Slack poster built on slack_sdk's AsyncWebClient.
+
+    Messages to the same channel share a rate budget (a JiraRateLimiter token bucket
+    per channel, about one message per second as chat.postMessage allows). A
+    `ratelimited` answer pauses the whole channel for its Retry-After before the
+    message is retried, instead of failing the run. Thread replies are posted
+    concurrently, or one after the other when their order in the thread matters.
+
+    With a DeliveryLedger every posted message is recorded with its `ts`, so delivering the same
+    report window again skips what was already posted, updates the messages whose content changed
+    (chat.update) and deletes the ones the report no longer has. Team messages are matched by content
+    hash, then by their teams, so adding or removing a team leaves the other messages untouched.
+
+    `base_url` points the client to another Slack API, e.g. FakeSlackServer in tests.
+    The coroutines run on their own event loop thread, so `post_report` can be
+    called from synchronous code and from notebooks with a running loop.
+    """
+
+    def __init__(self, token: str, base_url: Optional[str] = None, max_concurrency: int = 4,
+                 rate: float = 1.0, burst: int = 3, retries: int = 3, timeout: int = 30,
+                 backoff_base: float = 1.0, max_backoff: float = 30.0, ledger: Optional[DeliveryLedger] = None):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.token = token
+        self.base_url = base_url or os.getenv('SLACK_API_URL') or SLACK_API_URL
+        self.max_concurrency = max_concurrency
+        self.rate = rate
+        self.burst = burst
+        self.retries = retries
+        self.timeout = timeout
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self.ledger = ledger
+        self.window = None
+        self.logger = logging.getLogger(__name__)
+        self._limiters: Dict[str, JiraRateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def _limiter(self, channel: str) -> JiraRateLimiter:
+        """Rate budget of a channel, shared by every message posted to it"""
+        with self._lock:
+            if channel not in self._limiters:
+                self._limiters[channel] = JiraRateLimiter(rate=self.rate, burst=self.burst,
+                                                          max_concurrency=self.max_concurrency)
+            return self._limiters[channel]
+
+    async def _send(self, channel: str, call):
+        """Run one Slack API call under the channel budget, retrying rate limited and failed connections"""
+        limiter = self._limiter(channel)
+        for attempt in range(self.retries + 1):
+            await limiter.acquire_async()
+            try:
+                response = await call()
+            except SlackApiError as e:
+                status_code = e.response.status_code
+                retry_after = e.response.headers.get('Retry-After') or e.response.headers.get('retry-after')
+                # Retry-After pauses every message of the channel, not only this one
+                limiter.release(status_code, {'Retry-After': retry_after} if retry_after else None)
+                if status_code != 429 or attempt == self.retries:
+                    raise
+                self.logger.warning(f"Slack rate limited channel {channel}, retrying after {retry_after}s")
+                if not retry_after:
+                    await asyncio.sleep(JiraRateLimiter.backoff_time(attempt, self.backoff_base, self.max_backoff))
+                continue
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                limiter.release()
+                if attempt == self.retries:
+                    raise
+                self.logger.warning(f"Slack request failed ({str(e)}), retry {attempt + 1} of {self.retries}")
+                await asyncio.sleep(JiraRateLimiter.backoff_time(attempt, self.backoff_base, self.max_backoff))
+                continue
+            limiter.release(response.status_code)
+            return response
+
+    async def post(self, client: AsyncWebClient, channel: str, blocks: List[Dict[str, Any]],
+                   thread_ts: Optional[str] = None):
+        """Post one message under the channel budget"""
+        return await self._send(channel, lambda: client.chat_postMessage(channel=channel, blocks=blocks,
+                                                                         thread_ts=thread_ts))
+
+    async def deliver(self, client: AsyncWebClient, channel: str, part: str, blocks: List[Dict[str, Any]],
+                      thread_ts: Optional[str] = None, teams: Optional[List[str]] = None,
+                      position: Optional[int] = None, replaces: Optional[str] = None):
+        """
+        Post one part of a report, or with a ledger: skip it when it was already posted with the same blocks
+        and update it in place (chat.update) when its blocks changed. A part not posted yet updates the
+        message of the `replaces` part instead, when given.
+        """
+        if self.ledger is None:
+            return await self.post(client, channel, blocks, thread_ts)
+
+        block_hash = content_hash(blocks)
+        entry = self.ledger.get(channel, self.window, part)
+        if entry is not None and entry["hash"] == block_hash:
+            if position is not None and entry.get("position") != position:
+                self.ledger.record(channel, self.window, part, entry["ts"], block_hash, teams, position)
+            return {"ok": True, "channel": channel, "ts": entry["ts"], "skipped": True}
+        if entry is None and replaces is not None:
+            entry = self.ledger.get(channel, self.window, replaces)
+
+        response = None
+        if entry is not None:
+            try:
+                response = await self._send(channel, lambda: client.chat_update(channel=channel, ts=entry["ts"],
+                                                                                blocks=blocks))
+            except SlackApiError as e:
+                # Deleted from the channel since, post it again
+                if not isinstance(e.response.data, dict) or e.response["error"] != "message_not_found":
+                    raise
+        if response is None:
+            response = await self.post(client, channel, blocks, thread_ts)
+        self.ledger.record(channel, self.window, part, response["ts"], block_hash, teams, position, replaces)
+        return response
+
+    async def _post_chain(self, client: AsyncWebClient, channel: str, chain, thread_ts: str):
+        """Post messages one after the other, a failed message doesn't stop the next ones"""
+        responses = []
+        for position, blocks, teams, part, replaces in chain:
+            try:
+                responses.append(await self.deliver(client, channel, part, blocks, thread_ts, teams, position,
+                                                    replaces))
+            except (SlackApiError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                responses.append(e)
+        return responses
+
+    async def _post_report(self, channel: str, overview_blocks, header_blocks, team_blocks, preserve_order, chained,
+                           teams):
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
+            client = AsyncWebClient(token=self.token, base_url=self.base_url, session=session, timeout=self.timeout)
+            previous = self.ledger.get(channel, self.window, "overview") if self.ledger is not None else None
+            overview_response = await self.deliver(client, channel, "overview", overview_blocks)
+            thread_ts = overview_response["ts"]
+            if previous is not None and previous["ts"] != thread_ts:
+                # The overview was posted again, so its thread starts over too
+                for part in self.ledger.parts(channel, self.window):
+                    if part != "overview":
+                        self.ledger.remove(channel, self.window, part)
+            team_header_response = await self.deliver(client, channel, "team_header", header_blocks, thread_ts)
+
+            messages = self._plan_team_messages(channel, team_blocks, teams)
+            if preserve_order:
+                # Slack orders thread replies by arrival, so each reply waits for the previous one
+                team_responses = await self._post_chain(client, channel, messages, thread_ts)
+            else:
+                # Chains of messages that must keep their order are posted concurrently with each other
+                chains = []
+                for message in messages:
+                    if chains and chained and chained[message[0]]:
+                        chains[-1].append(message)
+                    else:
+                        chains.append([message])
+                chain_responses = await asyncio.gather(
+                    *(self._post_chain(client, channel, chain, thread_ts) for chain in chains)
+                )
+                team_responses = [response for responses in chain_responses for response in responses]
+
+            if self.ledger is not None:
+                keep = {part for message in messages for part in message[3:] if part is not None}
+                await self._delete_removed(client, channel, keep)
+            return overview_response, team_header_response, team_responses
+
+    def _plan_team_messages(self, channel: str, team_blocks, teams):
+        """
+        (position, blocks, teams, part, replaces) of every team message. Parts are keyed by content hash, a
+        message not posted yet replaces the unmatched previous message of the same teams, or sharing a team
+        """
+        previous = self.ledger.team_parts(channel, self.window) if self.ledger is not None else {}
+        parts, seen = [], {}
+        for blocks in team_blocks:
+            part = DeliveryLedger.team_part(content_hash(blocks))
+            # Identical messages in the same report get their own part
+            seen[part] = seen.get(part, 0) + 1
+            parts.append(part if seen[part] == 1 else f"{part}_{seen[part] - 1}")
+        unmatched = [part for part in previous if part not in parts]
+
+        messages = []
+        for position, (blocks, part) in enumerate(zip(team_blocks, parts)):
+            message_teams = teams[position] if teams else None
+            replaces = None
+            if part not in previous and message_teams:
+                same = [old for old in unmatched if previous[old].get("teams") == message_teams]
+                shared = [old for old in unmatched if set(previous[old].get("teams") or []) & set(message_teams)]
+                replaces = (same or shared or [None])[0]
+                if replaces is not None:
+                    unmatched.remove(replaces)
+            messages.append((position, blocks, message_teams, part, replaces))
+        return messages
+
+    async def _delete_removed(self, client: AsyncWebClient, channel: str, keep):
+        """Delete the team messages of a previous delivery that the report no longer has"""
+        for part, entry in self.ledger.team_parts(channel, self.window).items():
+            if part not in keep:
+                try:
+                    await self._send(channel, lambda: client.chat_delete(channel=channel, ts=entry["ts"]))
+                except SlackApiError as e:
+                    if not isinstance(e.response.data, dict) or e.response["error"] != "message_not_found":
+                        raise
+                self.ledger.remove(channel, self.window, part)
+
+    def post_report(self, channel: str, overview_blocks: List[Dict[str, Any]], header_blocks: List[Dict[str, Any]],
+                    team_blocks: List[List[Dict[str, Any]]], preserve_order: bool = False,
+                    chained: Optional[List[bool]] = None, teams: Optional[List[List[str]]] = None,
+                    window: Optional[str] = None):
+        """
+        Post the overview message, the team header in its thread, then one thread reply per `team_blocks` entry.
+        `chained[i]` marks a reply that must follow reply i - 1, e.g. the continuation of a team update.
+        `teams[i]` names the teams of reply i for the ledger, and `window` keys the delivery in it.
+        Returns (overview_response, team_header_response, team_responses), team_responses in `team_blocks` order
+        with the exception of a failed team instead of its response.
+        """
+        if self.ledger is not None and window is None:
+            raise ValueError("A window is needed to record the delivery in the ledger")
+        self.window = window
+        result = {}
+
+        def run():
+            try:
+                result["value"] = asyncio.run(self._post_report(channel, overview_blocks, header_blocks, team_blocks,
+                                                                preserve_order, chained, teams))
+            except Exception as e:
+                result["error"] = e
+
+        thread = threading.Thread(target=run, name="slack-delivery", daemon=True)
+        thread.start()
+        thread.join()
+        if "error" in result:
+            raise result["error"]
+        return result["value"]
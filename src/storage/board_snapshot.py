@@ -0,0 +1,197 @@
+import logging
+import os
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Columns of the board overview, in file order
+BOARD_COLUMNS = [
+    "key",
+    "summary",
+    "issue_link",
+    "status",
+    "created",
+    "last_update",
+    "description",
+    "labels",
+    "related_docs",
+    "teams",
+    "workstream",
+    "points_of_contact",
+    "child_issues",
+    "parent_issue",
+    "comments",
+    "last_comment_date",
+    "last_comment",
+]
+
+# List columns and the separator used when they are exported to CSV
+LIST_COLUMNS = {
+    "labels": ", ",
+    "points_of_contact": ", ",
+    "child_issues": ", ",
+    "comments": "\n",
+}
+
+DATE_COLUMNS = ["created", "last_update", "last_comment_date"]
+
+# Format of the DATE_COLUMNS values written by the extraction
+DATE_FORMAT = "%Y-%m-%d"
+
+logger = logging.getLogger(__name__)
+
+# Low cardinality columns stored dictionary encoded
+DICTIONARY_COLUMNS = ["status", "teams", "workstream"]
+
+BOARD_SCHEMA = pa.schema([
+    pa.field(column,
+             pa.dictionary(pa.int32(), pa.string()) if column in DICTIONARY_COLUMNS
+             else pa.timestamp("ms") if column in DATE_COLUMNS
+             else pa.list_(pa.string()) if column in LIST_COLUMNS
+             else pa.string())
+    for column in BOARD_COLUMNS
+])
+
+
+def snapshot_parquet_path(csv_path):
+    """Path of the columnar snapshot written next to a board overview CSV"""
+    return os.path.splitext(csv_path)[0] + ".parquet"
+
+
+def board_rows_to_table(rows):
+    """
+    Convert board rows (list of dicts or DataFrame) to an Arrow table.
+    Rows hold lists for LIST_COLUMNS and 'YYYY-MM-DD' strings for DATE_COLUMNS, empty strings become nulls.
+    """
+    df = rows if isinstance(rows, pd.DataFrame) else pd.DataFrame(rows, columns=BOARD_COLUMNS)
+    arrays = []
+    for field in BOARD_SCHEMA:
+        values = df[field.name].tolist()
+        if field.name in LIST_COLUMNS:
+            arrays.append(pa.array([list(value) if isinstance(value, (list, tuple)) else [] for value in values],
+                                   type=field.type))
+        elif field.name in DATE_COLUMNS:
+            raw = pd.Series([value or None for value in values], dtype=object)
+            dates = pd.to_datetime(raw, format=DATE_FORMAT, errors="coerce")
+            invalid = dates.isna() & raw.notna()
+            if invalid.any():
+                logger.warning(f"{invalid.sum()} {field.name} values are not {DATE_FORMAT} dates and are stored "
+                               f"empty: {raw[invalid].unique()[:10].tolist()}")
+            arrays.append(pa.array(dates, type=field.type, from_pandas=True))
+        else:
+            strings = [None if value is None or value == "" or value != value else str(value) for value in values]
+            array = pa.array(strings, type=pa.string())
+            arrays.append(array.dictionary_encode() if field.name in DICTIONARY_COLUMNS else array)
+    return pa.Table.from_arrays(arrays, schema=BOARD_SCHEMA)
+
+
+def table_to_board_rows(table):
+    """Convert an Arrow snapshot table (or a projection of it) back to board rows as a DataFrame"""
+    df = table.to_pandas()
+    for column in df.columns:
+        if column in LIST_COLUMNS:
+            df[column] = [list(value) if value is not None else [] for value in df[column]]
+        elif column in DATE_COLUMNS:
+            df[column] = df[column].dt.strftime(DATE_FORMAT).fillna("")
+        else:
+            df[column] = df[column].astype(object).where(df[column].notna(), "")
+    return df
+
+
+def board_rows_to_csv_frame(rows):
+    """Board rows in the CSV layout: list columns joined with their separator"""
+    df = rows if isinstance(rows, pd.DataFrame) else pd.DataFrame(rows, columns=BOARD_COLUMNS)
+    df = df.copy()
+    for column, separator in LIST_COLUMNS.items():
+        if column in df.columns:
+            df[column] = [separator.join(value) if isinstance(value, (list, tuple)) else value for value in df[column]]
+    return df
+
+
+def csv_frame_to_board_rows(df):
+    """Board rows from a CSV snapshot read as strings. Lists are split back with their separator"""
+    df = df.copy()
+    for column, separator in LIST_COLUMNS.items():
+        if column in df.columns:
+            df[column] = [value.split(separator) if value else [] for value in df[column]]
+    return df
+
+
+class BoardSnapshotWriter:
+    """Write the board overview incrementally, one batch of rows at a time.
+
+    The Parquet file is the canonical snapshot (typed dates, list columns,
+    dictionary encoded status/teams/workstream), the CSV is kept as an export.
+    Both go to temporary files that replace the targets only when the writer
+    is closed without error, so a failed run never leaves a truncated snapshot.
+    """
+
+    def __init__(self, csv_path, compression="zstd"):
+        self.csv_path = csv_path
+        self.parquet_path = snapshot_parquet_path(csv_path)
+        self.compression = compression
+        self.rows_written = 0
+        self._csv_tmp_path = csv_path + ".tmp"
+        self._parquet_tmp_path = self.parquet_path + ".tmp"
+        self._file = None
+        self._parquet_writer = None
+
+    def __enter__(self):
+        os.makedirs(os.path.dirname(self.csv_path) or ".", exist_ok=True)
+        self._file = open(self._csv_tmp_path, "w", encoding="utf-8", newline="")
+        self._parquet_writer = pq.ParquetWriter(self._parquet_tmp_path, BOARD_SCHEMA, compression=self.compression)
+        return self
+
+    def write(self, rows):
+        """Append a batch of board rows (list of dicts or DataFrame) to the snapshot"""
+        df = rows if isinstance(rows, pd.DataFrame) else pd.DataFrame(rows, columns=BOARD_COLUMNS)
+        if df.empty:
+            return
+        self._parquet_writer.write_table(board_rows_to_table(df))
+        board_rows_to_csv_frame(df).to_csv(self._file, header=self._file.tell() == 0, index=False)
+        self.rows_written += len(df)
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._file.tell() == 0:
+            # Keep the header even when the board is empty
+            pd.DataFrame(columns=BOARD_COLUMNS).to_csv(self._file, index=False)
+        self._file.close()
+        self._parquet_writer.close()
+        if exc_type is None:
+            os.replace(self._csv_tmp_path, self.csv_path)
+            os.replace(self._parquet_tmp_path, self.parquet_path)
+        else:
+            os.remove(self._csv_tmp_path)
+            os.remove(self._parquet_tmp_path)
+        return False
+
+
+def iter_board_snapshot(csv_path, batch_size=5000, columns=None):
+    """
+    Yield the board rows of a snapshot in batches, reading the Parquet snapshot when it exists
+    and the CSV export otherwise (snapshots written before the Parquet format)
+    """
+    parquet_path = snapshot_parquet_path(csv_path)
+    if os.path.exists(parquet_path):
+        parquet_file = pq.ParquetFile(parquet_path)
+        for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+            yield table_to_board_rows(pa.Table.from_batches([batch]))
+        return
+
+    for chunk in pd.read_csv(csv_path, dtype=str, keep_default_na=False, chunksize=batch_size, usecols=columns):
+        yield csv_frame_to_board_rows(chunk)
+
+
+def read_board_snapshot(path, columns=None):
+    """
+    Load a board overview for the processing tools, in the same layout as pd.read_csv of the CSV export.
+    `path` can be the Parquet snapshot or the CSV; the Parquet file next to a CSV is preferred.
+    Only the requested columns are read from the Parquet file.
+    """
+    parquet_path = path if path.endswith(".parquet") else snapshot_parquet_path(path)
+    if not os.path.exists(parquet_path):
+        return pd.read_csv(path, usecols=columns)
+
+    df = board_rows_to_csv_frame(table_to_board_rows(pq.read_table(parquet_path, columns=columns)))
+    # Empty cells are missing values, as read_csv would return them
+    return df.where(df != "")
@@ -1,40 +1,164 @@
+from src.storage.board_snapshot import BOARD_SCHEMA, board_rows_to_table
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 from datetime import datetime
-import json
+from urllib.parse import quote
 import os
 
+HISTORY_FOLDER = "history"
+
+# Partition columns of the history dataset, stored in the folder names (project=<id>/week=<%Y-W%W>)
+HISTORY_PARTITIONING = ds.partitioning(pa.schema([("project", pa.string()), ("week", pa.string())]), flavor="hive")
+
+# Board rows plus the date of the snapshot they come from
+HISTORY_SCHEMA = BOARD_SCHEMA.append(pa.field("snapshot_date", pa.timestamp("ms")))
+
+
+def week_of(date):
+    return date.strftime("%Y-W%W")
+
+
 class WeeklyDataManager:
-    def __init__(self, base_path="jira_weekly_data"):
+    """
+    History of the board snapshots, stored as a Hive partitioned Parquet dataset:
+    <base_path>/history/project=<project>/week=<%Y-W%W>/snapshot-<date>.parquet (zstd).
+
+    Each extraction appends its snapshot to the partition of its project and week, one file per day,
+    so re-running an extraction on the same day replaces that day's snapshot. Reads only open the
+    partitions and row groups matching the filters, and only the requested columns, so queries over
+    many weeks never load whole weeks in memory.
+    """
+
+    def __init__(self, base_path="jira_weekly_data", compression="zstd"):
         self.base_path = base_path
+        self.history_path = os.path.join(base_path, HISTORY_FOLDER)
+        self.compression = compression
 
-    def save_weekly_data(self, data, week=None):
-        """Save data with versioning"""
-        week = week or datetime.now().strftime("%Y-W%W")
-        folder_path = os.path.join(self.base_path, week)
-        os.makedirs(folder_path, exist_ok=True)
+    def _snapshot_path(self, project, snapshot_date):
+        folder = os.path.join(self.history_path, f"project={quote(str(project), safe='')}",
+                              f"week={week_of(snapshot_date)}")
+        return os.path.join(folder, f"snapshot-{snapshot_date.strftime('%Y-%m-%d')}.parquet")
 
-        # Save raw data
-        with open(f"{folder_path}/raw_data.json", "w") as f:
-            json.dump(data, f, indent=2)
+    def append_snapshot(self, batches, project, snapshot_date=None):
+        """
+        Append a board snapshot, given as batches of board rows (lists of dicts, DataFrames or Arrow tables),
+        to the history. The batches are streamed to the file, the snapshot is never held in memory.
+        Returns the written file path.
+        """
+        snapshot_date = pd.Timestamp(snapshot_date or datetime.now()).normalize()
+        path = self._snapshot_path(project, snapshot_date)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
 
-        # Save processed data
-        df = pd.DataFrame(data)
-        df.to_parquet(f"{folder_path}/processed_data.parquet")
+        # Write to a hidden temporary file first so a failed run never leaves a partial snapshot in the dataset
+        tmp_path = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.tmp")
+        try:
+            with pq.ParquetWriter(tmp_path, HISTORY_SCHEMA, compression=self.compression) as writer:
+                for batch in batches:
+                    table = batch if isinstance(batch, pa.Table) else board_rows_to_table(batch)
+                    if table.num_rows == 0:
+                        continue
+                    dates = pa.array([snapshot_date] * table.num_rows, type=pa.timestamp("ms"))
+                    writer.write_table(table.select(BOARD_SCHEMA.names).append_column("snapshot_date", dates))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        os.replace(tmp_path, path)
+        return path
 
-        return week
+    def append_board_snapshot(self, parquet_path, project, snapshot_date=None, batch_size=5000):
+        """Append the Parquet board snapshot written by the extraction, batch by batch"""
+        parquet_file = pq.ParquetFile(parquet_path)
+        batches = (pa.Table.from_batches([batch]) for batch in parquet_file.iter_batches(batch_size=batch_size))
+        return self.append_snapshot(batches, project, snapshot_date)
 
-    def get_weekly_data(self, week):
-        """Retrieve data for specific week"""
-        folder_path = os.path.join(self.base_path, week)
+    def save_weekly_data(self, data, week=None, project="default"):
+        """Save board rows as the snapshot of a week (the current one by default)"""
+        snapshot_date = datetime.strptime(week + "-1", "%Y-W%W-%w") if week else datetime.now()
+        self.append_snapshot([data], project, snapshot_date)
+        return week_of(snapshot_date)
 
-        try:
-            df = pd.read_parquet(f"{folder_path}/processed_data.parquet")
-            return df
-        except FileNotFoundError:
+    def dataset(self):
+        return ds.dataset(self.history_path, format="parquet", partitioning=HISTORY_PARTITIONING,
+                          ignore_prefixes=[".", "_"])
+
+    def read_history(self, columns=None, filters=None, project=None, weeks=None, start_date=None, end_date=None):
+        """
+        Query the history as a DataFrame.
+        `columns` selects the columns read, `filters` is a pyarrow Expression or DNF tuples
+        ([("status", "==", "Done")]) pushed down to the Parquet reader. `project`, `weeks` ([first, last])
+        and the snapshot dates prune partitions before any file is opened.
+        """
+        if not os.path.isdir(self.history_path):
+            return pd.DataFrame(columns=columns or HISTORY_SCHEMA.names + ["project", "week"])
+
+        expression = self._expression(filters, project, weeks, start_date, end_date)
+        table = self.dataset().to_table(columns=columns, filter=expression)
+        return table.to_pandas()
+
+    @staticmethod
+    def _expression(filters=None, project=None, weeks=None, start_date=None, end_date=None):
+        expressions = []
+        if filters is not None:
+            expressions.append(filters if isinstance(filters, ds.Expression) else pq.filters_to_expression(filters))
+        if project is not None:
+            expressions.append(ds.field("project") == str(project))
+        if weeks is not None:
+            expressions.append((ds.field("week") >= weeks[0]) & (ds.field("week") <= weeks[1]))
+        if start_date is not None:
+            start = pd.Timestamp(start_date)
+            expressions.append((ds.field("week") >= week_of(start)) & (ds.field("snapshot_date") >= start))
+        if end_date is not None:
+            end = pd.Timestamp(end_date)
+            expressions.append((ds.field("week") <= week_of(end)) & (ds.field("snapshot_date") <= end))
+        if not expressions:
             return None
+        expression = expressions[0]
+        for other in expressions[1:]:
+            expression = expression & other
+        return expression
+
+    def status_changes(self, project=None, team=None, start_date=None, end_date=None):
+        """
+        Status transitions between consecutive snapshots, e.g. every status change of a team in a quarter.
+        Only the key, summary, status, teams and snapshot date columns of the matching partitions are read.
+        """
+        filters = None
+        if team is not None:
+            filters = pc.match_substring(ds.field("teams").cast(pa.string()), team)
+        df = self.read_history(columns=["key", "summary", "status", "snapshot_date"], filters=filters,
+                               project=project, start_date=start_date, end_date=end_date)
+        columns = ["key", "summary", "from_status", "to_status", "snapshot_date"]
+        if df.empty:
+            return pd.DataFrame(columns=columns)
+
+        df["status"] = df["status"].astype(object)
+        df = df.sort_values(["key", "snapshot_date"], kind="stable")
+        df["from_status"] = df.groupby("key", sort=False)["status"].shift()
+        changed = df["from_status"].notna() & (df["from_status"] != df["status"])
+        return df.loc[changed].rename(columns={"status": "to_status"})[columns].reset_index(drop=True)
+
+    def get_weekly_data(self, week, project=None, columns=None):
+        """Retrieve the snapshots of a specific week, folders written before the history dataset included"""
+        legacy_path = os.path.join(self.base_path, week, "processed_data.parquet")
+        if os.path.exists(legacy_path):
+            return pd.read_parquet(legacy_path, columns=columns)
+
+        df = self.read_history(columns=columns, project=project, weeks=[week, week])
+        return df if not df.empty else None
 
     def list_available_weeks(self):
         """List all available weekly data"""
         if not os.path.exists(self.base_path):
             return []
-        return sorted(os.listdir(self.base_path))
+        weeks = {name for name in os.listdir(self.base_path)
+                 if os.path.exists(os.path.join(self.base_path, name, "processed_data.parquet"))}
+        if os.path.isdir(self.history_path):
+            with os.scandir(self.history_path) as projects:
+                for project in projects:
+                    if project.is_dir() and project.name.startswith("project="):
+                        weeks.update(entry.name.split("=", 1)[1] for entry in os.scandir(project.path)
+                                     if entry.is_dir() and entry.name.startswith("week="))
+        return sorted(weeks)
@@ -0,0 +1,96 @@
+import hashlib
+import json
+import os
+import threading
+
+LEDGER_SUFFIX = ".delivery.json"
+
+TEAM_PART_PREFIX = "team_message_"
+
+
+def ledger_path(report_file_path):
+    """slack_message.json -> slack_message.delivery.json"""
+    return os.path.splitext(report_file_path)[0] + LEDGER_SUFFIX
+
+
+def content_hash(blocks):
+    return hashlib.sha256(json.dumps(blocks, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class DeliveryLedger:
+    """
+    Slack messages already posted for a report, so an interrupted or repeated delivery resumes
+    instead of posting duplicates.
+
+    Deliveries are keyed by channel and report window, and each part of a delivery (the overview,
+    the team header and every team message) is stored with the `ts` Slack gave it and the hash of
+    the blocks it was posted with. Team messages are keyed by that hash (team_message_<hash>), so a
+    team added or removed mid-report doesn't shift the parts after it; their position in the report
+    is only stored to order them. The ledger is written after every recorded message.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._state = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return {}
+
+    @staticmethod
+    def delivery_key(channel, window):
+        return f"{channel}/{window}"
+
+    def parts(self, channel, window):
+        """{part: {"ts", "hash", "teams", "position"}} of a delivery"""
+        return dict(self._state.get(self.delivery_key(channel, window), {}))
+
+    def get(self, channel, window, part):
+        return self._state.get(self.delivery_key(channel, window), {}).get(part)
+
+    @staticmethod
+    def team_part(content_hash):
+        return f"{TEAM_PART_PREFIX}{content_hash}"
+
+    def team_parts(self, channel, window):
+        """{part: entry} of the team messages of a delivery, in report order"""
+        parts = {part: entry for part, entry in self.parts(channel, window).items()
+                 if part.startswith(TEAM_PART_PREFIX)}
+        return dict(sorted(parts.items(), key=lambda item: item[1].get("position", 0)))
+
+    def record(self, channel, window, part, ts, content_hash, teams=None, position=None, replaces=None):
+        """Record a posted part. `replaces` names a part updated into this one, forgotten in the same write"""
+        with self._lock:
+            entry = {"ts": ts, "hash": content_hash}
+            if teams is not None:
+                entry["teams"] = teams
+            if position is not None:
+                entry["position"] = position
+            delivery = self._state.setdefault(self.delivery_key(channel, window), {})
+            if replaces is not None and replaces != part:
+                delivery.pop(replaces, None)
+            delivery[part] = entry
+            self._save()
+
+    def remove(self, channel, window, part=None):
+        """Forget a part of a delivery, or the whole delivery"""
+        with self._lock:
+            key = self.delivery_key(channel, window)
+            if part is None:
+                self._state.pop(key, None)
+            else:
+                self._state.get(key, {}).pop(part, None)
+            self._save()
+
+    def _save(self):
+        # Write to a temporary file first so an interrupted run can't corrupt the ledger
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._state, f, indent=2)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta, timezone
+import json
+import os
+
+class ExtractionWatermarks:
+    """Persist the last extraction time and snapshot for each project/labels pair"""
+
+    def __init__(self, base_path="jira-weekly-data", filename=".watermarks.json"):
+        self.base_path = base_path
+        self.file_path = os.path.join(base_path, filename)
+
+    @staticmethod
+    def state_key(project_id, labels):
+        """Labels order doesn't change the extracted board"""
+        return f"{project_id}|{','.join(sorted(labels))}"
+
+    def _load(self):
+        if not os.path.exists(self.file_path):
+            return {}
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return {}
+
+    def get(self, project_id, labels):
+        """Return the stored state ({"watermark", "snapshot"}) or None when there is no usable snapshot"""
+        state = self._load().get(self.state_key(project_id, labels))
+        if not state or not os.path.exists(state.get("snapshot", "")):
+            return None
+        return state
+
+    def set(self, project_id, labels, watermark, snapshot):
+        """Store the watermark (timezone aware datetime) and the snapshot it belongs to"""
+        states = self._load()
+        states[self.state_key(project_id, labels)] = {
+            "watermark": watermark.astimezone(timezone.utc).isoformat(),
+            "snapshot": snapshot
+        }
+        os.makedirs(self.base_path, exist_ok=True)
+
+        # Write to a temporary file first so an interrupted run can't corrupt the state
+        tmp_path = self.file_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(states, f, indent=2)
+        os.replace(tmp_path, self.file_path)
+
+    @staticmethod
+    def to_jql_date(watermark, overlap_hours=24):
+        """
+        Format a stored watermark for an `updated >= "..."` JQL clause.
+        JQL dates are read in the Jira user's timezone, so the watermark is moved back by
+        `overlap_hours` to never miss an update. Re-fetched issues are merged by key, so the
+        overlap only costs a few extra issues.
+        """
+        moment = datetime.fromisoformat(watermark) - timedelta(hours=overlap_hours)
+        return moment.astimezone(timezone.utc).strftime("%Y/%m/%d %H:%M")
@@ -0,0 +1,67 @@
+from collections import OrderedDict
+
+
+class IssueMemoCache:
+    """
+    In-memory cache of Jira issue payloads for a single extraction run, keyed by issue key and updated timestamp.
+    Holds at most `max_entries` issues (and formatted comment lists), evicting the least recently used ones.
+    """
+
+    def __init__(self, max_entries=5000):
+        self.max_entries = max_entries
+        self._issues = OrderedDict()
+        self._comments = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        # Comment lookups are counted apart so the hit rate above stays the one of the issues
+        self.comment_hits = 0
+        self.comment_misses = 0
+
+    @staticmethod
+    def _updated(issue):
+        return (issue.get('fields') or {}).get('updated') or ''
+
+    def put(self, issue, key=None):
+        """
+        Store an issue payload. `key` can be given when the issue was requested under another key
+        (moved issues). An older version never replaces a newer one.
+        """
+        for cache_key in {issue['key'], key or issue['key']}:
+            cached = self._issues.get(cache_key)
+            if cached is None or self._updated(issue) >= self._updated(cached):
+                self._issues[cache_key] = issue
+                self._issues.move_to_end(cache_key)
+        self._evict(self._issues)
+
+    def _evict(self, entries):
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    def get(self, key, updated=None):
+        """Return the cached issue, or None when it is missing or older than `updated`"""
+        issue = self._issues.get(key)
+        if issue is None or (updated and self._updated(issue) < updated):
+            self.misses += 1
+            return None
+        self._issues.move_to_end(key)
+        self.hits += 1
+        return issue
+
+    def get_comments(self, issue):
+        """Return the formatted comments memoized for this version of the issue, or None"""
+        comments_key = (issue['key'], self._updated(issue))
+        comments = self._comments.get(comments_key)
+        if comments is None:
+            self.comment_misses += 1
+        else:
+            self._comments.move_to_end(comments_key)
+            self.comment_hits += 1
+        return comments
+
+    def put_comments(self, issue, comments):
+        self._comments[(issue['key'], self._updated(issue))] = comments
+        self._evict(self._comments)
+
+    def summary(self):
+        return (f"issue cache: {self.hits} hits, {self.misses} misses, "
+                f"comments: {self.comment_hits} hits, {self.comment_misses} misses")
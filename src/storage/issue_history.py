@@ -0,0 +1,171 @@
+from src.storage.board_snapshot import iter_board_snapshot
+from src.utils.issue_rules import DONE_STATUSES
+import os
+import sqlite3
+import threading
+import pandas as pd
+from datetime import datetime
+
+# Board columns kept in the history, read from the snapshot without the long text columns
+HISTORY_COLUMNS = ["key", "summary", "status", "teams", "workstream", "parent_issue", "last_update",
+                   "last_comment_date"]
+
+
+class IssueHistoryDB:
+    """File based SQLite database with one row per issue and board snapshot.
+
+    Each extraction adds its snapshot (one per project and day, a re-run of the same day replaces it),
+    so questions across weeks ("issues stale for three consecutive weeks", "status of team X per week")
+    are answered by indexed queries instead of loading every snapshot. Indexed on issue key, team,
+    status and last_update. Only the standard library is needed, everything runs offline.
+    """
+
+    def __init__(self, path: str = "jira-weekly-data/issue-history.sqlite"):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS snapshots (
+                id INTEGER PRIMARY KEY,
+                project TEXT NOT NULL,
+                snapshot_date TEXT NOT NULL,
+                week TEXT NOT NULL,
+                issues INTEGER NOT NULL DEFAULT 0,
+                UNIQUE (project, snapshot_date)
+            );
+            CREATE TABLE IF NOT EXISTS issue_snapshots (
+                snapshot_id INTEGER NOT NULL REFERENCES snapshots (id) ON DELETE CASCADE,
+                key TEXT NOT NULL,
+                summary TEXT,
+                status TEXT,
+                team TEXT,
+                teams TEXT,
+                workstream TEXT,
+                parent_issue TEXT,
+                last_update TEXT,
+                last_comment_date TEXT,
+                PRIMARY KEY (snapshot_id, key)
+            );
+            CREATE INDEX IF NOT EXISTS issue_snapshots_key ON issue_snapshots (key, snapshot_id);
+            CREATE INDEX IF NOT EXISTS issue_snapshots_team ON issue_snapshots (team, status);
+            CREATE INDEX IF NOT EXISTS issue_snapshots_status ON issue_snapshots (status);
+            CREATE INDEX IF NOT EXISTS issue_snapshots_last_update ON issue_snapshots (last_update);
+            CREATE INDEX IF NOT EXISTS snapshots_week ON snapshots (project, week);
+        """)
+        self._db.execute("PRAGMA foreign_keys = ON")
+        self._db.commit()
+
+    def ingest_snapshot(self, batches, project: str, snapshot_date=None) -> int:
+        """
+        Add a board snapshot, given as batches of board rows (DataFrames in the board rows layout).
+        A snapshot already stored for the same project and day is replaced. Returns the number of issues.
+        """
+        snapshot_date = pd.Timestamp(snapshot_date or datetime.now()).normalize()
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM snapshots WHERE project = ? AND snapshot_date = ?",
+                             (project, snapshot_date.strftime("%Y-%m-%d")))
+            snapshot_id = self._db.execute(
+                "INSERT INTO snapshots (project, snapshot_date, week) VALUES (?, ?, ?)",
+                (project, snapshot_date.strftime("%Y-%m-%d"), snapshot_date.strftime("%Y-W%W"))
+            ).lastrowid
+
+            issues = 0
+            for batch in batches:
+                rows = batch.reindex(columns=HISTORY_COLUMNS).astype(object)
+                # Empty cells are stored as NULL
+                rows = rows.where(rows.notna() & (rows != ""), None)
+                team = rows["teams"].str.split(",").str[0].str.strip()
+                self._db.executemany(
+                    """INSERT OR REPLACE INTO issue_snapshots
+                       (snapshot_id, key, summary, status, team, teams, workstream, parent_issue, last_update,
+                        last_comment_date)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    zip([snapshot_id] * len(rows), rows["key"], rows["summary"], rows["status"],
+                        team.where(team.notna(), None), rows["teams"], rows["workstream"], rows["parent_issue"],
+                        rows["last_update"], rows["last_comment_date"])
+                )
+                issues += len(rows)
+            self._db.execute("UPDATE snapshots SET issues = ? WHERE id = ?", (issues, snapshot_id))
+        return issues
+
+    def ingest_board_snapshot(self, csv_path: str, project: str, snapshot_date=None, batch_size: int = 5000) -> int:
+        """Add the board snapshot written by the extraction, reading only the history columns in batches"""
+        return self.ingest_snapshot(iter_board_snapshot(csv_path, batch_size=batch_size, columns=HISTORY_COLUMNS),
+                                    project, snapshot_date)
+
+    def query(self, sql: str, params=()) -> pd.DataFrame:
+        """Run a read-only SQL query on the history"""
+        with sqlite3.connect(f"file:{self.path}?mode=ro", uri=True) as db:
+            return pd.read_sql_query(sql, db, params=params)
+
+    def snapshots(self, project: str = None) -> pd.DataFrame:
+        return self.query(
+            "SELECT project, snapshot_date, week, issues FROM snapshots WHERE (? IS NULL OR project = ?) "
+            "ORDER BY project, snapshot_date", (project, project))
+
+    def stale_issues(self, weeks: int = 3, project: str = None, team: str = None, as_of: str = None,
+                     exclude_statuses=DONE_STATUSES) -> pd.DataFrame:
+        """
+        Issues with the same last_update in the last `weeks` weekly snapshots (the latest snapshot of each week),
+        not updated since before the first of them, and not in a closed status. Projects with fewer weekly
+        snapshots return nothing.
+        """
+        exclude_statuses = list(exclude_statuses or [])
+        status_filter = f"AND COALESCE(s.status, '') NOT IN ({', '.join('?' * len(exclude_statuses))})" \
+            if exclude_statuses else ""
+        return self.query(f"""
+            WITH weekly AS (
+                SELECT project, week, MAX(id) AS snapshot_id, MAX(snapshot_date) AS snapshot_date
+                FROM snapshots
+                WHERE (? IS NULL OR project = ?) AND (? IS NULL OR snapshot_date <= ?)
+                GROUP BY project, week
+            ), recent_weeks AS (
+                SELECT * FROM (
+                    SELECT *, ROW_NUMBER() OVER (PARTITION BY project ORDER BY week DESC) AS position FROM weekly
+                ) WHERE position <= ?
+            )
+            SELECT w.project, s.key, MAX(s.summary) AS summary, MAX(s.team) AS team, MAX(s.status) AS status,
+                   MAX(s.last_update) AS last_update, MIN(w.week) AS stale_since_week
+            FROM recent_weeks w JOIN issue_snapshots s ON s.snapshot_id = w.snapshot_id
+            WHERE (? IS NULL OR s.team = ?) {status_filter}
+            GROUP BY w.project, s.key
+            HAVING COUNT(*) = ? AND COUNT(DISTINCT COALESCE(s.last_update, '')) = 1
+                   AND COALESCE(MAX(s.last_update), '') < MIN(w.snapshot_date)
+            ORDER BY w.project, MAX(s.team), MAX(s.last_update)
+        """, (project, project, as_of, as_of, weeks, team, team, *exclude_statuses, weeks))
+
+    def issue_timeline(self, key: str) -> pd.DataFrame:
+        """Every stored snapshot of an issue, oldest first"""
+        return self.query("""
+            SELECT sn.project, sn.snapshot_date, sn.week, s.status, s.team, s.last_update, s.last_comment_date
+            FROM issue_snapshots s JOIN snapshots sn ON sn.id = s.snapshot_id
+            WHERE s.key = ?
+            ORDER BY sn.snapshot_date
+        """, (key,))
+
+    def status_counts(self, project: str = None, team: str = None, start_week: str = None,
+                      end_week: str = None) -> pd.DataFrame:
+        """Issues per status in the latest snapshot of every week"""
+        return self.query("""
+            WITH weekly AS (
+                SELECT project, week, MAX(id) AS snapshot_id FROM snapshots
+                WHERE (? IS NULL OR project = ?) AND (? IS NULL OR week >= ?) AND (? IS NULL OR week <= ?)
+                GROUP BY project, week
+            )
+            SELECT w.project, w.week, s.status, COUNT(*) AS issues
+            FROM weekly w JOIN issue_snapshots s ON s.snapshot_id = w.snapshot_id
+            WHERE (? IS NULL OR s.team = ?)
+            GROUP BY w.project, w.week, s.status
+            ORDER BY w.project, w.week, s.status
+        """, (project, project, start_week, start_week, end_week, end_week, team, team))
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
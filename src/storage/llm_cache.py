@@ -0,0 +1,90 @@
+from src.utils.tokens import estimate_tokens
+import hashlib
+import json
+import os
+import threading
+
+
+class LLMResultCache:
+    """Content addressed cache of LLM results, stored as one JSON file per entry.
+
+    Entries are keyed by the hash of the full prompt (report content, prompt template
+    and its parameters) and the model name, so an unchanged team report is never sent
+    to the LLM twice. Reading an entry marks it as recently used; the least recently
+    used entries are evicted once the cache directory exceeds `max_bytes`.
+    """
+
+    def __init__(self, path="jira-weekly-data/.llm-cache", max_bytes=64 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.saved_tokens = 0
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+
+    @staticmethod
+    def make_key(prompt, model):
+        raw = json.dumps([model, prompt], separators=(',', ':'))
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.path, f"{key}.json")
+
+    def get(self, key, prompt_tokens=0):
+        """
+        Return the cached result, or None. On a hit, the estimated prompt and result tokens
+        of the avoided LLM call are added to `saved_tokens`
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, "r", encoding="utf-8") as f:
+                result = json.load(f)
+            os.utime(entry_path)  # Mark as recently used
+        except (OSError, json.JSONDecodeError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+            self.saved_tokens += prompt_tokens + estimate_tokens(json.dumps(result))
+        return result
+
+    def put(self, key, result):
+        # Write to a temporary file first so concurrent readers never see a partial entry
+        entry_path = self._entry_path(key)
+        tmp_path = f"{entry_path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(result, f)
+        os.replace(tmp_path, entry_path)
+        self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        with self._lock:
+            entries = []
+            with os.scandir(self.path) as scan:
+                for entry in scan:
+                    if entry.name.endswith(".json"):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total = sum(size for _, size, _ in entries)
+            for _, size, entry_path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(entry_path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+
+    def clear(self):
+        with self._lock:
+            with os.scandir(self.path) as scan:
+                for entry in scan:
+                    if entry.name.endswith(".json"):
+                        os.remove(entry.path)
+
+    def summary(self):
+        return f"llm cache: {self.hits} hits, {self.misses} misses, ~{self.saved_tokens} tokens saved"
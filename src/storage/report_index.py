@@ -0,0 +1,98 @@
+import json
+import mmap
+import os
+
+INDEX_SUFFIX = ".index.json"
+
+
+def report_index_path(report_path):
+    """Path of the byte offset index written next to a markdown report"""
+    return report_path + INDEX_SUFFIX
+
+
+def section_id(name):
+    """'Updated Issues' and 'updated_issues' both name the updated_issues section"""
+    return "_".join(name.strip().lower().replace("-", " ").split())
+
+
+class ReportIndex:
+    """
+    Byte offsets of the sections and issues of a markdown report, so agents can read
+    one section or a few issues with a seek instead of loading the whole report.
+
+    Issues are stored as {key: {"section", "start", "end", "parent", "children_end"}}, where
+    `end` closes the issue itself and `children_end` the issue followed by its children.
+    """
+
+    def __init__(self, base_offset=0):
+        self.base_offset = base_offset  # Added to every offset, for reports rendered in memory first
+        self.sections = {}
+        self.issues = {}
+        self.size = None
+
+    def add_section(self, name, start, end):
+        self.sections[section_id(name)] = [self.base_offset + start, self.base_offset + end]
+
+    def add_issue(self, key, section, start, end, parent=None):
+        start, end = self.base_offset + start, self.base_offset + end
+        self.issues[key] = {"section": section_id(section), "start": start, "end": end,
+                            "parent": parent, "children_end": end}
+        if parent in self.issues:
+            self.issues[parent]["children_end"] = end
+
+    def update(self, other):
+        """Merge the entries of another index (offsets are already absolute)"""
+        self.sections.update(other.sections)
+        self.issues.update(other.issues)
+
+    def save(self, report_path):
+        """Store the index next to the report, with the report size to detect stale indexes"""
+        self.size = os.path.getsize(report_path)
+        tmp_path = report_index_path(report_path) + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"size": self.size, "sections": self.sections, "issues": self.issues}, f)
+        os.replace(tmp_path, report_index_path(report_path))
+
+    @classmethod
+    def load(cls, report_path):
+        """Return the index of a report, or None when it is missing or older than the report"""
+        try:
+            with open(report_index_path(report_path), "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if state.get("size") != os.path.getsize(report_path):
+            return None
+        index = cls()
+        index.size = state["size"]
+        index.sections = state.get("sections", {})
+        index.issues = state.get("issues", {})
+        return index
+
+    def read_section(self, report_path, name):
+        """Text of one section, None when the report has no such section"""
+        span = self.sections.get(section_id(name))
+        if span is None:
+            return None
+        with open(report_path, "rb") as f:
+            f.seek(span[0])
+            return f.read(span[1] - span[0]).decode("utf-8")
+
+    def read_issues(self, report_path, keys, include_children=True):
+        """
+        Text of the requested issues in the given order, with their children when `include_children`.
+        Returns the text and the keys that are not in the report.
+        """
+        found, missing = [], []
+        for key in keys:
+            if key in self.issues:
+                found.append(self.issues[key])
+            else:
+                missing.append(key)
+        if not found:
+            return "", missing
+
+        with open(report_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            parts = [data[issue["start"]:issue["children_end"] if include_children else issue["end"]]
+                     for issue in found]
+        return b"".join(parts).decode("utf-8"), missing
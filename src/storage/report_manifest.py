@@ -0,0 +1,123 @@
+from src.storage.report_index import ReportIndex, report_index_path
+from src.utils.issue_rules import prefilled_path
+from src.utils.tokens import estimate_file_tokens
+import json
+import os
+
+MANIFEST_FILENAME = "manifest.json"
+
+
+class ReportManifest:
+    """
+    Content hashes of the team reports of a teams-markdown/<window> folder.
+
+    Each report file is stored with the hash of the board rows it was rendered from,
+    and `dirty` lists the files written by the last run, so later stages can skip
+    the teams that did not change. The entries also carry the team name, issue counts,
+    size and estimated tokens, which makes the manifest the folder's report catalog.
+    """
+
+    def __init__(self, folder, filename=MANIFEST_FILENAME):
+        self.folder = folder
+        self.file_path = os.path.join(folder, filename)
+        self._state = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.file_path):
+            return {}
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return {}
+
+    @property
+    def exists(self):
+        return bool(self._state)
+
+    @property
+    def reports(self):
+        """{file name: {"team", "hash", "issues", "updated_issues", "tokens", "size"}} of the last run"""
+        return self._state.get("reports", {})
+
+    @property
+    def dirty(self):
+        """Report files re-rendered by the last run"""
+        return self._state.get("dirty", [])
+
+    def is_current(self, file_name, content_hash):
+        """True when the report exists and was rendered from the same content"""
+        entry = self.reports.get(file_name)
+        return (entry is not None and entry.get("hash") == content_hash
+                and os.path.exists(os.path.join(self.folder, file_name)))
+
+    def save(self, reports, dirty):
+        """
+        Store the hashes of this run and the files it re-rendered.
+        Reports of teams that are no longer on the board are removed.
+        """
+        for file_name in set(self.reports) - set(reports):
+            stale_path = os.path.join(self.folder, file_name)
+            for path in (stale_path, report_index_path(stale_path), prefilled_path(stale_path)):
+                if os.path.exists(path):
+                    os.remove(path)
+
+        for file_name, entry in reports.items():
+            report_path = os.path.join(self.folder, file_name)
+            entry["size"] = os.path.getsize(report_path) if os.path.exists(report_path) else None
+
+        self._state = {"reports": reports, "dirty": sorted(dirty)}
+        os.makedirs(self.folder, exist_ok=True)
+
+        # Write to a temporary file first so an interrupted run can't corrupt the manifest
+        tmp_path = self.file_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._state, f, indent=2)
+        os.replace(tmp_path, self.file_path)
+
+    def catalog(self):
+        """One entry per team report, sorted by team name"""
+        dirty = set(self.dirty)
+        return [
+            {
+                "team": entry.get("team"),
+                "file": file_name,
+                "path": os.path.join(self.folder, file_name),
+                "size": entry.get("size"),
+                "issues": entry.get("issues"),
+                "updated_issues": entry.get("updated_issues"),
+                "tokens": entry.get("tokens"),
+                "dirty": file_name in dirty
+            }
+            for file_name, entry in sorted(self.reports.items(), key=lambda item: str(item[1].get("team")))
+        ]
+
+
+def load_report_catalog(folder):
+    """
+    Catalog of the team reports of a folder. Uses the manifest when generate_teams_markdown wrote one,
+    otherwise scans the folder, reads the counts from the report indexes when they exist and estimates
+    the tokens of each report.
+    """
+    manifest = ReportManifest(folder)
+    if manifest.exists:
+        return manifest.catalog()
+
+    catalog = []
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if not entry.is_file() or not entry.name.endswith(('.md', '.markdown')):
+                continue
+            index = ReportIndex.load(entry.path)
+            catalog.append({
+                "team": os.path.splitext(entry.name)[0].replace('_', ' '),
+                "file": entry.name,
+                "path": entry.path,
+                "size": entry.stat().st_size,
+                "issues": len(index.issues) if index else None,
+                "updated_issues": sum(issue["section"] == "updated_issues" for issue in index.issues.values())
+                if index else None,
+                "tokens": estimate_file_tokens(entry.path),
+                "dirty": True
+            })
+    return sorted(catalog, key=lambda item: item["team"])
@@ -1,4 +1,5 @@
 """Utility functions for Jira data processing"""
 from .formatters import format_content_to_markdown
+from .markdown_writer import MarkdownWriter
 
-__all__ = ["format_content_to_markdown"]
+__all__ = ["format_content_to_markdown", "MarkdownWriter"]
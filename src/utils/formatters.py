@@ -1,11 +1,12 @@
 """Utility functions for formatting Jira data"""
+from .markdown_writer import MarkdownWriter
 
 def format_content_to_markdown(content):
     """Convert Jira's JSON content format to markdown"""
     if not content or not isinstance(content, dict):
         return ""
 
-    markdown_text = ""
+    writer = MarkdownWriter()
 
     for item in content.get("content", []):
         # Handle headings
@@ -15,11 +16,10 @@ def format_content_to_markdown(content):
                 content.get("text", "")
                 for content in item.get("content", [])
             )
-            markdown_text += f"{'#' * level} {heading_text}\n\n"
+            writer.write(f"{'#' * level} {heading_text}\n\n")
 
         # Handle paragraphs
         elif item["type"] == "paragraph":
-            paragraph_text = ""
             for content in item.get("content", []):
                 if content["type"] == "text":
                     # Check for marks (bold, italic, etc)
@@ -28,26 +28,26 @@ def format_content_to_markdown(content):
                         for mark in content["marks"]:
                             if mark["type"] == "strong":
                                 text = f"**{text}**"
-                    paragraph_text += text
+                    writer.write(text)
                 elif content["type"] == "mention":
-                    paragraph_text += f"@{content['attrs'].get('text', '')}"
+                    writer.write(f"@{content['attrs'].get('text', '')}")
                 elif content["type"] == "emoji":
-                    paragraph_text += f":{content['attrs'].get('shortName', '')[1:-1]}:"
+                    writer.write(f":{content['attrs'].get('shortName', '')[1:-1]}:")
                 elif content["type"] == "inlineCard":
-                    paragraph_text += f"[{content['attrs'].get('url', '')}]"
-            markdown_text += f"{paragraph_text}\n\n"
+                    writer.write(f"[{content['attrs'].get('url', '')}]")
+            writer.write("\n\n")
 
         # Handle bullet lists
         elif item["type"] == "bulletList":
             for list_item in item.get("content", []):
                 list_content = list_item.get("content", [{}])[0].get("content", [])
-                item_text = ""
+                writer.write("* ")
                 for content in list_content:
                     if content.get("type") == "text":
-                        item_text += content.get("text", "")
+                        writer.write(content.get("text", ""))
                     elif content.get("type") == "mention":
-                        item_text += f"@{content['attrs'].get('text', '')}"
-                markdown_text += f"* {item_text}\n"
-            markdown_text += "\n"
+                        writer.write(f"@{content['attrs'].get('text', '')}")
+                writer.write("\n")
+            writer.write("\n")
 
-    return markdown_text.strip()
\ No newline at end of file
+    return writer.getvalue().strip()
\ No newline at end of file
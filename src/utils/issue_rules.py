@@ -0,0 +1,86 @@
+"""Deterministic classification of board issues, for the follow-ups that need no analysis"""
+import numpy as np
+import pandas as pd
+
+PREFILLED_SUFFIX = ".prefilled.json"
+
+DONE_STATUSES = ["Done", "Closed", "Resolved", "Won't Do", "Cancelled"]
+
+# Rules in priority order: the first matching rule picks the follow-up template of an issue
+RULES = ["done_with_open_children", "stale", "no_update_in_window", "no_comments"]
+
+FOLLOWUP_TEMPLATES = {
+    "done_with_open_children": "{mention}{key} is marked as {status} but {open_children} of its child issues are still "
+                               "open. Should they be closed or moved to another issue?",
+    "stale": "{mention}{key} has no updates for more than {stale_weeks} weeks (last update on {last_update}). "
+             "Is it still planned, or should it be re-prioritized or closed?",
+    "no_update_in_window": "{mention}{key} had no updates between {start_date} and {end_date}. "
+                           "Could you share its current status and next steps?",
+    "no_comments": "{mention}{key} has no comments yet. Could you add a short note on its progress?",
+}
+
+
+def prefilled_path(report_path):
+    """Path of the pre-classified follow-ups written next to a team report"""
+    return report_path + PREFILLED_SUFFIX
+
+
+def mention(name):
+    """John Doe -> @johndoe, the mention format used in the follow-ups"""
+    return "@" + "".join(name.split()).lower()
+
+
+def classify_issues(df, start_date, end_date, stale_weeks=4, done_statuses=DONE_STATUSES):
+    """
+    Evaluate every rule on every board row at once.
+    Returns a boolean DataFrame with one column per rule (same index as df) and the
+    number of open child issues of each row.
+    """
+    last_update = pd.to_datetime(df['last_update'])
+    done = df['status'].isin(done_statuses)
+    has_comments = df['comments'].notna() & (df['comments'].astype(str).str.strip() != "")
+
+    # Child issues are the board rows pointing to the issue through parent_issue
+    open_child = df['parent_issue'].notna() & ~done
+    open_children = df['key'].map(df.loc[open_child, 'parent_issue'].value_counts()).fillna(0).astype(int)
+
+    rules = pd.DataFrame({
+        "done_with_open_children": done & (open_children > 0),
+        "stale": last_update.isna() | (last_update < pd.to_datetime(end_date) - pd.Timedelta(weeks=stale_weeks)),
+        "no_update_in_window": ~((last_update >= pd.to_datetime(start_date)) & (last_update <= pd.to_datetime(end_date))),
+        "no_comments": ~has_comments,
+    }, index=df.index)
+    return rules[RULES], open_children
+
+
+def mechanical_issues(rules):
+    """Issues whose follow-up is fully decided by a rule, as a boolean array"""
+    return rules.to_numpy().any(axis=1)
+
+
+def primary_rules(rules):
+    """Name of the first matching rule of each issue, None when no rule matches"""
+    values = rules.to_numpy()
+    return np.where(values.any(axis=1), np.array(RULES, dtype=object)[values.argmax(axis=1)], None)
+
+
+def prefilled_followup(issue, rule, contacts, open_children, start_date, end_date, stale_weeks):
+    """Follow-up entry, in the team JSON format, for an issue decided by `rule`"""
+    last_update = issue['last_update']
+    text = FOLLOWUP_TEMPLATES[rule].format(
+        mention=f"{mention(contacts[0])} " if contacts else "",
+        key=issue['key'],
+        status=issue['status'],
+        open_children=open_children,
+        stale_weeks=stale_weeks,
+        last_update=last_update.strftime('%Y-%m-%d') if pd.notna(last_update) else "unknown",
+        start_date=start_date,
+        end_date=end_date,
+    )
+    return {
+        "id": issue['key'],
+        "title": issue['summary'],
+        "url": issue['issue_link'] if pd.notna(issue['issue_link']) else "",
+        "workstream": issue['workstream'] if pd.notna(issue['workstream']) else "",
+        "fup": text,
+    }
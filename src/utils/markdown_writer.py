@@ -0,0 +1,73 @@
+"""Streaming writer for the generated markdown reports"""
+import io
+import os
+
+
+class MarkdownWriter:
+    """
+    Collect markdown fragments without building one growing string.
+
+    With a `path`, fragments go straight to a buffered file handle, so a report
+    never has to fit in memory. Without one, they are kept in a list and joined
+    once by `getvalue()`. Both cases render in linear time.
+
+    Files are written to a temporary path that replaces `path` only when the
+    writer is closed without error, so readers never see a partial report.
+    `tell()` returns the UTF-8 byte offset reached, used to index the report.
+    """
+
+    def __init__(self, path=None, buffer_size=io.DEFAULT_BUFFER_SIZE * 8):
+        self.path = path
+        self._parts = [] if path is None else None
+        self._tmp_path = path + ".tmp" if path is not None else None
+        self._file = open(self._tmp_path, 'wb', buffering=buffer_size) if path is not None else None
+        self._size = 0
+
+    def write(self, *fragments):
+        """Append fragments in order"""
+        self.writelines(fragments)
+
+    def writelines(self, fragments):
+        """Append an iterable of fragments"""
+        for fragment in fragments:
+            data = fragment.encode('utf-8')
+            self._size += len(data)
+            if self._file is not None:
+                self._file.write(data)
+            else:
+                self._parts.append(fragment)
+
+    def tell(self):
+        """Bytes written so far, as UTF-8"""
+        return self._size
+
+    def getvalue(self):
+        """Markdown written so far (in-memory writers only)"""
+        if self._parts is None:
+            raise ValueError("getvalue() is only available when writing to memory")
+        value = "".join(self._parts)
+        # Keep a single fragment so repeated calls stay cheap
+        self._parts[:] = [value]
+        return value
+
+    def close(self):
+        """Flush the report and move it into place"""
+        if self._file is not None and not self._file.closed:
+            self._file.close()
+            os.replace(self._tmp_path, self.path)
+
+    def discard(self):
+        """Drop a partially written report, leaving any previous file untouched"""
+        if self._file is not None and not self._file.closed:
+            self._file.close()
+            os.remove(self._tmp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+        return False
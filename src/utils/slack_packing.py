@@ -0,0 +1,129 @@
+"""Packing of the team updates into the fewest Slack messages that respect the Block Kit limits"""
+
+# Block Kit limits of a chat.postMessage call
+MAX_BLOCKS = 50
+MAX_SECTION_CHARS = 3000
+MAX_HEADER_CHARS = 150
+
+
+def section(text):
+    return {"type": "section", "text": {"type": "mrkdwn", "text": text}}
+
+
+def split_text(text, limit=MAX_SECTION_CHARS):
+    """Split a text in chunks of at most `limit` characters, at line breaks or spaces when possible"""
+    chunks = []
+    while len(text) > limit:
+        cut = text.rfind("\n", 0, limit + 1)
+        if cut <= 0:
+            cut = text.rfind(" ", 0, limit + 1)
+        if cut <= 0:
+            cut = limit
+        chunks.append(text[:cut])
+        text = text[cut:].lstrip("\n ")
+    chunks.append(text)
+    return chunks
+
+
+def pack_texts(texts, limit=MAX_SECTION_CHARS, separator="\n\n"):
+    """Join consecutive texts into as few sections as possible, splitting the ones longer than a section"""
+    sections, current = [], None
+    for text in texts:
+        for chunk in split_text(text, limit):
+            if current is not None and len(current) + len(separator) + len(chunk) <= limit:
+                current += separator + chunk
+            else:
+                if current is not None:
+                    sections.append(current)
+                current = chunk
+    if current is not None:
+        sections.append(current)
+    return sections
+
+
+def fit_sections(blocks):
+    """Blocks with every section text longer than the Slack limit split over consecutive sections"""
+    fitted = []
+    for block in blocks:
+        text = block.get("text", {})
+        if block["type"] == "section" and len(text.get("text", "")) > MAX_SECTION_CHARS and "accessory" not in block:
+            fitted.extend({**block, "text": {**text, "text": chunk}} for chunk in split_text(text["text"]))
+        else:
+            fitted.append(block)
+    return fitted
+
+
+def validate_message(blocks):
+    """Raise ValueError when a message would be rejected by Slack for its size"""
+    if not blocks:
+        raise ValueError("A Slack message needs at least one block")
+    if len(blocks) > MAX_BLOCKS:
+        raise ValueError(f"Slack message with {len(blocks)} blocks, the limit is {MAX_BLOCKS}")
+    for position, block in enumerate(blocks):
+        text = block.get("text", {}).get("text", "")
+        limit = MAX_HEADER_CHARS if block["type"] == "header" else MAX_SECTION_CHARS
+        if len(text) > limit:
+            raise ValueError(f"Block {position} ({block['type']}) has {len(text)} characters, the limit is {limit}")
+
+
+def issue_text(issue):
+    text = f"• <{issue['url']}|*{issue['id']}*> - {issue['title']}"
+    if issue.get('fup'):
+        text += f"\n> {issue['fup']}"
+    return text
+
+
+def team_sections(team):
+    """Header and issue sections of a team update. Issues share sections up to the character limit"""
+    header = f"*{team['name']}:*\nPoints of contact: {', '.join(team['contacts'])}"
+    issues = (team.get('updated_issues') or []) + (team.get('no_update_issues') or [])
+    return split_text(header), pack_texts([issue_text(issue) for issue in issues])
+
+
+def plan_team_messages(teams, max_blocks=MAX_BLOCKS):
+    """
+    Pack the team updates, in report order, into the fewest messages of at most `max_blocks` blocks.
+
+    Teams that fit in one message are never split: they are added to the current message (after a divider)
+    while it has room, otherwise they start the next one. Teams larger than a message start a new message and
+    continue over the following ones, each continuation repeating the team name. Every message is validated
+    before it is returned, so size errors come up before any API call.
+    Returns [{"blocks": [...], "teams": [team names]}] in posting order.
+    """
+    messages, current = [], None
+
+    def start_message():
+        message = {"blocks": [], "teams": []}
+        messages.append(message)
+        return message
+
+    for team in teams:
+        header, issues = team_sections(team)
+        blocks = [section(text) for text in header + issues]
+
+        if len(blocks) <= max_blocks:
+            # Divider between teams sharing a message
+            needed = len(blocks) + (1 if current is not None and current["blocks"] else 0)
+            if current is None or len(current["blocks"]) + needed > max_blocks:
+                current = start_message()
+            elif current["blocks"]:
+                current["blocks"].append({"type": "divider"})
+            current["blocks"].extend(blocks)
+            current["teams"].append(team['name'])
+            continue
+
+        # Oversized team, continuation messages repeat the team name
+        continuation = section(f"*{team['name']} (continued):*")
+        current = start_message()
+        current["blocks"].extend(section(text) for text in header)
+        current["teams"].append(team['name'])
+        for block in (section(text) for text in issues):
+            if len(current["blocks"]) >= max_blocks:
+                current = start_message()
+                current["blocks"].append(continuation)
+                current["teams"].append(team['name'])
+            current["blocks"].append(block)
+
+    for message in messages:
+        validate_message(message["blocks"])
+    return messages
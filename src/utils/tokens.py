@@ -0,0 +1,31 @@
+"""Local token count estimate for text sent to the LLM"""
+import re
+
+# Words, runs of digits, single punctuation characters and line breaks
+_TOKEN_PIECES = re.compile(r"[^\W\d_]+|\d+|\n+|[^\w\s]|_")
+
+
+def estimate_tokens(text):
+    """
+    Approximate the number of tokens of a text the way BPE tokenizers split it, without any network call:
+    short words are one token, longer words one token per 6 characters, numbers one token per 3 digits
+    and every punctuation character or line break one token. It errs on the high side for English prose,
+    which is what a budget needs.
+    """
+    if not text:
+        return 0
+    tokens = 0
+    for piece in _TOKEN_PIECES.findall(text):
+        if piece[0].isdigit():
+            tokens += (len(piece) + 2) // 3
+        elif piece[0].isalpha():
+            tokens += (len(piece) + 5) // 6
+        else:
+            tokens += 1
+    return tokens
+
+
+def estimate_file_tokens(path):
+    """estimate_tokens of a UTF-8 text file, such as a rendered team report"""
+    with open(path, "r", encoding="utf-8") as f:
+        return estimate_tokens(f.read())